@@ -2,13 +2,15 @@
 
 from __future__ import annotations
 
+import functools
 import os
-from urllib.parse import urlparse
+from contextvars import ContextVar
+from typing import Callable
 
 from reflex.config import get_config
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
 from starlette.requests import Request
 from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from .services import (
     SESSION_COOKIE_MAX_AGE,
@@ -18,18 +20,47 @@ from .services import (
 )
 
 
+_TRUE = frozenset({"1", "true", "yes", "on"})
+_FALSE = frozenset({"0", "false", "no", "off"})
+
+
+# Session id of the HTTP request being handled, for code that has no access to the scope.
+_session_id_var: ContextVar[str | None] = ContextVar("session_id", default=None)
+
+
+def current_session_id() -> str | None:
+    """Return the session id resolved by SessionCookieMiddleware for this request."""
+    return _session_id_var.get()
+
+
 def _env_secure_cookie_override() -> bool | None:
     raw = os.getenv("PLAYGROUND_SESSION_COOKIE_SECURE")
-    if raw is None or raw.strip() == "":
+    if raw is None:
         return None
     value = raw.strip().lower()
-    if value in {"1", "true", "yes", "on"}:
+    if value in _TRUE:
         return True
-    if value in {"0", "false", "no", "off"}:
+    if value in _FALSE:
         return False
     return None
 
 
+# Read once at import; every cookie-writing path uses this same value.
+_ENV_SECURE_OVERRIDE = _env_secure_cookie_override()
+
+
+def _secure_override(secure: bool | None) -> bool | None:
+    """Explicit setting first, then the environment; None leaves it to the request."""
+    return _ENV_SECURE_OVERRIDE if secure is None else secure
+
+
+@functools.lru_cache(maxsize=1)
+def _deploy_is_https() -> bool:
+    """Whether the configured deploy URL is served over HTTPS (read once)."""
+    deploy = (get_config().deploy_url or "").strip()
+    return deploy[:6].lower() == "https:"
+
+
 def _infer_secure_cookie(request: Request | None) -> bool:
     """Derive whether to mark cookies secure based on the request/deploy URL."""
 
@@ -53,13 +84,7 @@ def _infer_secure_cookie(request: Request | None) -> bool:
         if scheme == "https":
             return True
 
-    deploy = (get_config().deploy_url or "").strip()
-    if deploy:
-        parsed = urlparse(deploy)
-        if parsed.scheme.lower() == "https":
-            return True
-
-    return False
+    return _deploy_is_https()
 
 
 def issue_session_cookie(
@@ -69,7 +94,7 @@ def issue_session_cookie(
     secure: bool | None = None,
     request: Request | None = None,
 ) -> None:
-    override = _env_secure_cookie_override() if secure is None else secure
+    override = _secure_override(secure)
     flag = override if override is not None else _infer_secure_cookie(request)
     response.set_cookie(
         SESSION_COOKIE_NAME,
@@ -82,30 +107,152 @@ def issue_session_cookie(
     )
 
 
-class SessionCookieMiddleware(BaseHTTPMiddleware):
+# Encoded once: both the Cookie scanner needle and the Set-Cookie prefix.
+_SESSION_COOKIE_NAME_EQ = SESSION_COOKIE_NAME.encode("ascii") + b"="
+
+# Set-Cookie attribute suffixes shared by every response the middleware decorates.
+_COOKIE_SUFFIX_PLAIN = f"; HttpOnly; Max-Age={SESSION_COOKIE_MAX_AGE}; Path=/; SameSite=lax".encode(
+    "latin-1"
+)
+_COOKIE_SUFFIX_SECURE = _COOKIE_SUFFIX_PLAIN + b"; Secure"
+
+
+def _session_cookie_header(session_id: str, suffix: bytes) -> tuple[bytes, bytes]:
+    """Build the raw Set-Cookie header issued by the middleware."""
+    return b"set-cookie", _SESSION_COOKIE_NAME_EQ + session_id.encode("ascii") + suffix
+
+
+def _extract_cookie(header: bytes, needle: bytes = _SESSION_COOKIE_NAME_EQ) -> str | None:
+    """Return the value for ``needle`` (a ``name=`` prefix) from a raw Cookie header."""
+    # bytes.find runs in C, so large third-party cookie jars are never split apart.
+    start = 0
+    while True:
+        index = header.find(needle, start)
+        if index < 0:
+            return None
+        if index == 0 or header[index - 1] in b" ;":
+            begin = index + len(needle)
+            end = header.find(b";", begin)
+            value = header[begin:] if end < 0 else header[begin:end]
+            return value.strip().decode("latin-1")
+        start = index + 1
+
+
+def _xfp_first_proto(xfp: bytes) -> bytes:
+    """Return the lower-cased first hop of an X-Forwarded-Proto value (may be empty)."""
+    comma = xfp.find(b",")
+    head = xfp[:comma] if comma >= 0 else xfp
+    return head.strip().lower()
+
+
+def _scope_is_https(scope: Scope, xfp: bytes | None, forwarded: bytes | None) -> bool:
+    if forwarded is not None:
+        # RFC 7239 parsing is rare enough to reuse the Request-based helper.
+        return _infer_secure_cookie(Request(scope))
+    if xfp is not None:
+        proto = _xfp_first_proto(xfp)
+        if proto:
+            return proto == b"https"
+    # Like _infer_secure_cookie: a missing or blank proxy proto defers to the scheme.
+    return scope.get("scheme") == "https"
+
+
+_SuffixResolver = Callable[[Scope, bytes | None, bytes | None], bytes]
+
+
+def _make_suffix_resolver(explicit: bool | None) -> _SuffixResolver:
+    """Fold the fixed parts of issue_session_cookie's secure-flag decision into a suffix lookup."""
+    # Same order and the same cached inputs as issue_session_cookie, so both agree.
+    explicit = _secure_override(explicit)
+    if explicit is None and _deploy_is_https():
+        explicit = True
+    if explicit is None:
+        # Only proxy headers or the request scheme can decide.
+        return lambda scope, xfp, forwarded: (
+            _COOKIE_SUFFIX_SECURE if _scope_is_https(scope, xfp, forwarded) else _COOKIE_SUFFIX_PLAIN
+        )
+    suffix = _COOKIE_SUFFIX_SECURE if explicit else _COOKIE_SUFFIX_PLAIN
+    return lambda _scope, _xfp, _forwarded: suffix
+
+
+class SessionCookieMiddleware:
     """Ensure every HTTP request has a server-issued session cookie."""
 
-    def __init__(self, app, *, secure: bool | None = None):
-        super().__init__(app)
-        self._secure_override = _env_secure_cookie_override() if secure is None else secure
+    __slots__ = ("app", "_skip_prefixes", "_suffix_for")
 
-    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
-        incoming = request.cookies.get(SESSION_COOKIE_NAME)
+    # Asset routes never touch session state, so they skip the session lookup.
+    _SKIP_PREFIXES = ("/_next/", "/static/", "/assets/", "/favicon")
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        *,
+        secure: bool | None = None,
+        skip_prefixes: tuple[str, ...] | None = None,
+    ):
+        self.app = app
+        self._skip_prefixes = self._SKIP_PREFIXES if skip_prefixes is None else tuple(skip_prefixes)
+        self._suffix_for = _make_suffix_resolver(secure)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"].startswith(self._skip_prefixes):
+            await self.app(scope, receive, send)
+            return
+
+        incoming = xfp = forwarded = None
+        for name, value in scope["headers"]:
+            # First occurrence wins, as with request.headers.get() in
+            # _infer_secure_cookie; HTTP/2 may also split cookies over headers.
+            if name == b"cookie":
+                if incoming is None:
+                    incoming = _extract_cookie(value)
+            elif name == b"x-forwarded-proto":
+                if xfp is None:
+                    xfp = value
+            elif name == b"forwarded":
+                if forwarded is None:
+                    forwarded = value
+
+        metadata = None
+        if incoming:
+            # First visits carry no cookie; skip the lookup and its raised exception.
+            try:
+                # create_if_missing=False never creates, so the flag is always False.
+                metadata, _ = session_runtime.resolve_or_create(
+                    incoming,
+                    create_if_missing=False,
+                )
+            except SessionNotFoundError:
+                pass
+        session_id = metadata.session_id if metadata else None
+        scope.setdefault("state", {})["session_id"] = session_id
+
+        token = _session_id_var.set(session_id)
         try:
-            metadata, created = session_runtime.resolve_or_create(
-                incoming,
-                create_if_missing=False,
-            )
-            request.state.session_id = metadata.session_id
-        except SessionNotFoundError:
-            metadata, created = None, False
-            request.state.session_id = None
-        response = await call_next(request)
-        if metadata and (created or incoming != metadata.session_id):
-            issue_session_cookie(
-                response,
-                metadata.session_id,
-                secure=self._secure_override,
-                request=request,
+            # Only a cookie that had to be normalised (e.g. upper-cased) gets rewritten.
+            if metadata is None or incoming == session_id:
+                # Nothing to set: hand the original send through untouched.
+                await self.app(scope, receive, send)
+                return
+
+            cookie_header = _session_cookie_header(
+                session_id, self._suffix_for(scope, xfp, forwarded)
             )
-        return response
+            await self.app(scope, receive, self._send_with_cookie(send, cookie_header))
+        finally:
+            _session_id_var.reset(token)
+
+    @staticmethod
+    def _send_with_cookie(send: Send, cookie_header: tuple[bytes, bytes]) -> Send:
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                # The spec only promises an iterable, but Starlette hands over its own
+                # raw_headers list, so append in place and copy only as a fallback.
+                headers = message.setdefault("headers", [])
+                if type(headers) is list:
+                    headers.append(cookie_header)
+                else:
+                    message["headers"] = [*headers, cookie_header]
+            await send(message)
+
+        return send_wrapper
@@ -1,39 +1,155 @@
 from __future__ import annotations
 
+import functools
 import json
-from typing import Any, Dict
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Mapping
 
 import reflex as rx
 from reflex.components.radix.themes.components.badge import Badge
 from reflex.config import get_config
+from reflex.vars.base import var_operation, var_operation_return
+from reflex.vars.sequence import StringVar
 from starlette.requests import Request
 from starlette.responses import RedirectResponse
 from urllib.parse import unquote
 
 from .components import MonacoEditor
-from .services import ENVIRONMENT_FIELDS, SessionRepository, session_runtime
+from .services import (
+    ENVIRONMENT_FIELDS,
+    EnvironmentField,
+    SessionRepository,
+    session_runtime,
+)
 from .middleware import SessionCookieMiddleware, issue_session_cookie
 from .state import PlaygroundState
 
 
 # Modern dark theme color scheme inspired by blockchain explorers
-COLORS = {
-    "bg_primary": "#0a0a0b",
-    "bg_secondary": "#151518",
-    "bg_tertiary": "#1a1a1d",
-    "border": "#27272a",
-    "border_subtle": "#1f1f23",
-    "text_primary": "#ffffff",
-    "text_secondary": "#a1a1aa",
-    "text_muted": "#71717a",
-    "accent_purple": "#8b5cf6",
-    "accent_blue": "#3b82f6",
-    "accent_cyan": "#06b6d4",
-    "success": "#10b981",
-    "warning": "#f59e0b",
-    "error": "#ef4444",
-    "text_black": "#000000",
+_BG_PRIMARY = "#0a0a0b"
+_BG_SECONDARY = "#151518"
+_BG_TERTIARY = "#1a1a1d"
+_BORDER_COLOR = "#27272a"
+_BORDER_SUBTLE_COLOR = "#1f1f23"
+_TEXT_PRIMARY = "#ffffff"
+_TEXT_SECONDARY = "#a1a1aa"
+_TEXT_MUTED = "#71717a"
+_ACCENT_PURPLE = "#8b5cf6"
+_ACCENT_BLUE = "#3b82f6"
+_ACCENT_CYAN = "#06b6d4"
+_SUCCESS = "#10b981"
+_WARNING = "#f59e0b"
+_ERROR = "#ef4444"
+_TEXT_BLACK = "#000000"
+
+# Read-only view of the palette for callers that look colors up by name.
+COLORS: Mapping[str, str] = MappingProxyType({
+    "bg_primary": _BG_PRIMARY,
+    "bg_secondary": _BG_SECONDARY,
+    "bg_tertiary": _BG_TERTIARY,
+    "border": _BORDER_COLOR,
+    "border_subtle": _BORDER_SUBTLE_COLOR,
+    "text_primary": _TEXT_PRIMARY,
+    "text_secondary": _TEXT_SECONDARY,
+    "text_muted": _TEXT_MUTED,
+    "accent_purple": _ACCENT_PURPLE,
+    "accent_blue": _ACCENT_BLUE,
+    "accent_cyan": _ACCENT_CYAN,
+    "success": _SUCCESS,
+    "warning": _WARNING,
+    "error": _ERROR,
+    "text_black": _TEXT_BLACK,
+})
+
+
+_BORDER = f"1px solid {_BORDER_COLOR}"
+_BORDER_SUBTLE = f"1px solid {_BORDER_SUBTLE_COLOR}"
+_BOX_SHADOW = "0 4px 6px -1px rgba(0, 0, 0, 0.3), 0 2px 4px -1px rgba(0, 0, 0, 0.2)"
+_MONO_FONT = "'Fira Code', 'Monaco', 'Courier New', monospace"
+_TITLE_GRADIENT = f"linear-gradient(135deg, {_ACCENT_PURPLE} 0%, {_ACCENT_CYAN} 100%)"
+
+# Default styles for the themed helpers, built once at import.
+_CARD_STYLE: Dict[str, Any] = {
+    "background": _BG_SECONDARY,
+    "border": _BORDER,
+    "border_radius": "12px",
+    "padding": "24px",
+    "display": "flex",
+    "flex_direction": "column",
+    "gap": "16px",
+    "width": "100%",
+    "box_shadow": _BOX_SHADOW,
+    "max_height": "720px",
+    "overflow": "hidden",
+}
+# Flex (fullscreen) cards grow with their content instead of clipping.
+_CARD_FLEX_STYLE: Dict[str, Any] = {
+    key: value
+    for key, value in _CARD_STYLE.items()
+    if key not in ("max_height", "overflow")
+}
+_INPUT_STYLE: Dict[str, Any] = {
+    "background": _BG_TERTIARY,
+    "border": _BORDER,
+    "border_radius": "8px",
+    "color": _TEXT_PRIMARY,
+    "font_size": "14px",
+    "_focus": {
+        "border_color": _ACCENT_CYAN,
+        "outline": "none",
+    },
+}
+_TEXTAREA_STYLE: Dict[str, Any] = {
+    **_INPUT_STYLE,
+    "resize": "vertical",
+}
+_SELECT_STYLE: Dict[str, Any] = {
+    "background": _BG_TERTIARY,
+    "border": _BORDER,
+    "border_radius": "8px",
+    "color": _TEXT_PRIMARY,
 }
+_COLOR_MAP: Dict[str, str] = {
+    "purple": _ACCENT_PURPLE,
+    "blue": _ACCENT_BLUE,
+    "cyan": _ACCENT_CYAN,
+    "success": _SUCCESS,
+    "warning": _WARNING,
+    "error": _ERROR,
+}
+_BUTTON_HOVER: Dict[str, str] = {
+    "opacity": "0.9",
+    "transform": "translateY(-1px)",
+}
+_BUTTON_BASE_STYLE: Dict[str, Any] = {
+    "color": "white",
+    "border": "none",
+    "border_radius": "8px",
+    "padding_x": "20px",
+    "padding_y": "10px",
+    "font_weight": "500",
+    "font_size": "14px",
+    "cursor": "pointer",
+    "transition": "all 0.2s",
+    "_hover": _BUTTON_HOVER,
+}
+# Complete button style per color scheme, so calls only merge caller overrides.
+_BUTTON_STYLES: Dict[str, Dict[str, Any]] = {
+    scheme: {**_BUTTON_BASE_STYLE, "background": color}
+    for scheme, color in _COLOR_MAP.items()
+}
+
+
+def maybe(condition, component: rx.Component) -> rx.Component:
+    """Render ``component`` only while the reactive ``condition`` holds."""
+    return rx.cond(condition, component, rx.fragment())
+
+
+def _with_style(factory, defaults: Mapping[str, Any], /, *children, **kwargs) -> rx.Component:
+    """Create a component with style ``defaults`` that ``kwargs`` may override."""
+    if kwargs.keys().isdisjoint(defaults):
+        return factory(*children, **defaults, **kwargs)
+    return factory(*children, **{**defaults, **kwargs})
 
 
 def card(
@@ -41,28 +157,13 @@ def card(
     **kwargs,
 ) -> rx.Component:
     """Modern card component with dark theme styling."""
-    default_style = {
-        "background": COLORS["bg_secondary"],
-        "border": f"1px solid {COLORS['border']}",
-        "border_radius": "12px",
-        "padding": "24px",
-        "display": "flex",
-        "flex_direction": "column",
-        "gap": "16px",
-        "width": "100%",
-        "box_shadow": "0 4px 6px -1px rgba(0, 0, 0, 0.3), 0 2px 4px -1px rgba(0, 0, 0, 0.2)",
-        "max_height": "720px",
-        "overflow": "hidden",
-    }
-    if kwargs.get("flex"):
-        default_style.pop("max_height", None)
-        default_style.pop("overflow", None)
-    return rx.box(*children, **{**default_style, **kwargs})
+    default_style = _CARD_FLEX_STYLE if kwargs.get("flex") else _CARD_STYLE
+    return _with_style(rx.box, default_style, *children, **kwargs)
 
 
 def panel_expand_icon(panel_id: str) -> rx.Component:
     is_expanded = PlaygroundState.expanded_panel == panel_id
-    icon_color = COLORS["text_secondary"]
+    icon_color = _TEXT_SECONDARY
 
     icon = rx.cond(
         is_expanded,
@@ -77,8 +178,8 @@ def panel_expand_icon(panel_id: str) -> rx.Component:
             cursor="pointer",
             padding="6px",
             border_radius="999px",
-            background=COLORS["bg_tertiary"],
-            _hover={"background": COLORS["bg_secondary"]},
+            background=_BG_TERTIARY,
+            _hover={"background": _BG_SECONDARY},
         ),
         content=rx.cond(
             is_expanded,
@@ -98,23 +199,23 @@ def section_header(
 ) -> rx.Component:
     """Section header with optional fullscreen icon and trailing controls."""
 
-    heading_contents = []
+    heading = rx.heading(
+        title,
+        size="5",
+        color=_TEXT_PRIMARY,
+        font_weight="600",
+    )
     if icon:
-        heading_contents.append(
+        heading_contents: tuple[rx.Component, ...] = (
             rx.icon(
                 tag=icon,
                 size=18,
-                color=COLORS["accent_cyan"],
-            )
-        )
-    heading_contents.append(
-        rx.heading(
-            title,
-            size="5",
-            color=COLORS["text_primary"],
-            font_weight="600",
+                color=_ACCENT_CYAN,
+            ),
+            heading,
         )
-    )
+    else:
+        heading_contents = (heading,)
 
     title_row = rx.hstack(
         rx.hstack(
@@ -123,115 +224,170 @@ def section_header(
             gap="8px",
         ),
         rx.spacer(),
-        rx.cond(
-            trailing is not None,
-            trailing,
-            rx.fragment(),
-        ),
-        rx.cond(
-            panel_id is not None,
-            panel_expand_icon(panel_id),
-            rx.fragment(),
-        ),
+        # The arguments are plain Python values, so decide here rather than in rx.cond.
+        *((trailing,) if trailing is not None else ()),
+        *((panel_expand_icon(panel_id),) if panel_id is not None else ()),
         align_items="center",
         width="100%",
         gap="12px",
     )
 
-    description_el = rx.cond(
-        description != "",
-        rx.text(
-            description,
-            color=COLORS["text_secondary"],
-            size="2",
-            line_height="1.6",
-        ),
-        rx.fragment(),
-    )
+    description_el: tuple[rx.Component, ...] = ()
+    if description:
+        description_el = (
+            rx.text(
+                description,
+                color=_TEXT_SECONDARY,
+                size="2",
+                line_height="1.6",
+            ),
+        )
 
     return rx.vstack(
         title_row,
-        description_el,
+        *description_el,
         gap="8px",
         align_items="start",
         width="100%",
     )
 
 
+_CODE_VIEWER_CONTAINER_STYLE: Dict[str, Any] = {
+    "width": "100%",
+    "overflow": "auto",
+    "background": _BG_TERTIARY,
+    "border": _BORDER,
+    "borderRadius": "8px",
+    "padding": "12px",
+}
+
+
+@functools.lru_cache(maxsize=8)
+def _code_viewer_base_style(font_size: str, boxed: bool) -> Dict[str, Any]:
+    style: Dict[str, Any] = {
+        "margin": "0",
+        "fontSize": font_size,
+        "width": "100%",
+    }
+    if not boxed:
+        style["flex"] = "1 1 auto"
+        style["minHeight"] = "0"
+    return style
+
+
+def _code_viewer_placeholder(message: str | rx.Var) -> rx.Component:
+    return rx.text(
+        message,
+        color=_TEXT_SECONDARY,
+        font_style="italic",
+        font_size="14px",
+    )
+
+
+# Past this size large JSON results are shown unhighlighted.
+CODE_HIGHLIGHT_MAX_CHARS = 20_000
+
+
+@var_operation
+def _code_length(value: StringVar):
+    # StringVar.length() splits into code points first; UTF-16 length is enough here.
+    return var_operation_return(js_expression=f"({value}?.length ?? 0)", var_type=int)
+
+
+_PLAIN_CODE_STYLE: Dict[str, Any] = {
+    "fontFamily": _MONO_FONT,
+    "whiteSpace": "pre-wrap",
+    "wordBreak": "break-word",
+    "color": _TEXT_PRIMARY,
+}
+
+
 def code_viewer(
     value: str,
     language: str,
-    empty_message: str,
+    empty_message: str | rx.Var,
     font_size: str = "14px",
     *,
     boxed: bool = True,
     style: Dict[str, Any] | None = None,
     container_style: Dict[str, Any] | None = None,
     style_overrides: Dict[str, Any] | None = None,
+    plain_over: int | None = None,
 ) -> rx.Component:
-    """Reusable code viewer with optional container chrome."""
-
-    def _viewer():
-        viewer_style = {
-            "margin": "0",
-            "fontSize": font_size,
-            "width": "100%",
-        }
-        if not boxed:
-            viewer_style["flex"] = "1 1 auto"
-            viewer_style["minHeight"] = "0"
-        if style:
-            viewer_style.update(style)
-        return rx.code_block(
-            value,
-            language=language,
-            wrap_lines=True,
-            style=viewer_style,
-            width="100%",
-        )
-
-    content = rx.cond(
-        value == "",
-        rx.text(
-            empty_message,
-            color=COLORS["text_secondary"],
-            font_style="italic",
-            font_size="14px",
-        ),
-        _viewer(),
+    """Reusable code viewer with optional container chrome.
+
+    With ``plain_over`` set, values longer than that many characters are shown
+    as plain preformatted text instead of being syntax highlighted.
+    """
+
+    viewer_style = _code_viewer_base_style(font_size, boxed)
+    if style:
+        viewer_style = {**viewer_style, **style}
+
+    placeholder = _code_viewer_placeholder(empty_message)
+    viewer = rx.code_block(
+        value,
+        language=language,
+        wrap_lines=True,
+        style=viewer_style,
+        width="100%",
     )
+    if plain_over is not None:
+        # The highlighter tokenizes the whole string, visible or not.
+        viewer = rx.cond(
+            _code_length(value) > plain_over,
+            rx.el.pre(value, style={**viewer_style, **_PLAIN_CODE_STYLE}),
+            viewer,
+        )
+    content = rx.cond(value == "", placeholder, viewer)
 
     if not boxed:
         return content
 
-    container = {
-        "width": "100%",
-        "overflow": "auto",
-        "background": COLORS["bg_tertiary"],
-        "border": f"1px solid {COLORS['border']}",
-        "borderRadius": "8px",
-        "padding": "12px",
-    }
-    if container_style:
-        container.update(container_style)
-    box_props = container.copy()
-    if style_overrides:
-        box_props.update(style_overrides)
-    return rx.box(content, **box_props)
+    overrides = {**(container_style or {}), **(style_overrides or {})}
+    return _with_style(rx.box, _CODE_VIEWER_CONTAINER_STYLE, content, **overrides)
+
+
+# Static styles for the per-entry log markup; only the entry fields vary.
+_LOG_BADGE_STYLE: Dict[str, Any] = {
+    "color": "white",
+    "padding_x": "8px",
+    "padding_y": "4px",
+    "border_radius": "999px",
+    "font_size": "11px",
+    "font_weight": "600",
+    "letter_spacing": "0.02em",
+    "font_family": "'Inter', sans-serif",
+}
+_LOG_DETAIL_STYLE: Dict[str, Any] = {
+    "color": _TEXT_SECONDARY,
+    "font_family": _MONO_FONT,
+    "font_size": "12px",
+    "white_space": "pre-wrap",
+    "background": _BG_SECONDARY,
+    "border": _BORDER,
+    "border_radius": "8px",
+    "padding": "10px",
+    "width": "100%",
+}
+_LOG_ENTRY_STYLE: Dict[str, Any] = {
+    "width": "100%",
+    "padding": "12px",
+    "border": _BORDER_SUBTLE,
+    "border_radius": "10px",
+    "background": _BG_SECONDARY,
+    # Let the browser skip layout and paint for entries scrolled out of view;
+    # the intrinsic size keeps the scrollbar stable until they are rendered.
+    "content_visibility": "auto",
+    "contain_intrinsic_size": "auto 96px",
+}
 
 
 def log_entry_item(entry):
     badge = rx.box(
         entry["level_label"],
         background=entry["color"],
-        color="white",
-        padding_x="8px",
-        padding_y="4px",
-        border_radius="999px",
-        font_size="11px",
-        font_weight="600",
-        letter_spacing="0.02em",
-        font_family="'Inter', sans-serif",
+        **_LOG_BADGE_STYLE,
     )
     return rx.box(
         rx.vstack(
@@ -239,13 +395,13 @@ def log_entry_item(entry):
                 badge,
                 rx.text(
                     entry["timestamp"],
-                    color=COLORS["text_secondary"],
+                    color=_TEXT_SECONDARY,
                     size="1",
                 ),
                 rx.spacer(),
                 rx.text(
                     entry["action"],
-                    color=COLORS["text_primary"],
+                    color=_TEXT_PRIMARY,
                     font_weight="600",
                     size="2",
                 ),
@@ -255,38 +411,25 @@ def log_entry_item(entry):
             ),
             rx.text(
                 entry["message"],
-                color=COLORS["text_primary"],
+                color=_TEXT_PRIMARY,
                 size="2",
             ),
-            rx.cond(
-                entry["detail"] == "",
-                rx.fragment(),
-                rx.text(
-                    entry["detail"],
-                    color=COLORS["text_secondary"],
-                    font_family="'Fira Code', 'Monaco', 'Courier New', monospace",
-                    font_size="12px",
-                    white_space="pre-wrap",
-                    background=COLORS["bg_secondary"],
-                    border=f"1px solid {COLORS['border']}",
-                    border_radius="8px",
-                    padding="10px",
-                    width="100%",
-                ),
+            maybe(
+                entry["detail"] != "",
+                rx.text(entry["detail"], **_LOG_DETAIL_STYLE),
             ),
             spacing="3",
             width="100%",
         ),
-        width="100%",
-        padding="12px",
-        border=f"1px solid {COLORS['border_subtle']}",
-        border_radius="10px",
-        background=COLORS["bg_secondary"],
+        # Entries are prepended; keying by id keeps existing rows in place.
+        key=entry["id"],
+        **_LOG_ENTRY_STYLE,
     )
 
 
+@functools.lru_cache(maxsize=8)
 def panel_style(base_height: str | None, is_fullscreen: bool) -> Dict[str, Any]:
-    """Create a consistent panel container style."""
+    """Create a consistent panel container style (shared; do not mutate)."""
     style: Dict[str, Any] = {
         "width": "100%",
         "display": "flex",
@@ -334,94 +477,64 @@ def panel_stack(
     )
 
 
-def resolve_panel_context(
-    card_kwargs: Dict[str, Any] | None, base_height: str | None
-) -> tuple[Dict[str, Any], bool, Dict[str, Any]]:
-    """Normalize card kwargs and return fullscreen flag plus base style."""
-    card_kwargs = card_kwargs or {}
-    is_fullscreen = card_kwargs.get("flex") is not None
-    return card_kwargs, is_fullscreen, panel_style(base_height, is_fullscreen)
 
 def styled_input(**kwargs) -> rx.Component:
     """Styled input field with dark theme."""
-    default_style = {
-        "background": COLORS["bg_tertiary"],
-        "border": f"1px solid {COLORS['border']}",
-        "border_radius": "8px",
-        "color": COLORS["text_primary"],
-        "font_size": "14px",
-        "_focus": {
-            "border_color": COLORS["accent_cyan"],
-            "outline": "none",
-        },
-    }
-    return rx.input(**{**default_style, **kwargs})
+    return _with_style(rx.input, _INPUT_STYLE, **kwargs)
 
 
 def styled_text_area(**kwargs) -> rx.Component:
     """Styled text area with dark theme."""
-    default_style = {
-        "background": COLORS["bg_tertiary"],
-        "border": f"1px solid {COLORS['border']}",
-        "border_radius": "8px",
-        "color": COLORS["text_primary"],
-        "font_size": "14px",
-        "resize": "vertical",
-        "_focus": {
-            "border_color": COLORS["accent_cyan"],
-            "outline": "none",
-        },
-    }
-    return rx.text_area(**{**default_style, **kwargs})
+    return _with_style(rx.text_area, _TEXTAREA_STYLE, **kwargs)
+
+
+# Responsive values used by the session panel; they never vary between builds.
+_ROW_DIRECTION = rx.breakpoints(initial="column", md="row")
+_ROW_WRAP = rx.breakpoints(initial="wrap", md="nowrap")
+_BUTTONS_JUSTIFY = rx.breakpoints(initial="start", md="end")
+_AUTO_WIDTH = rx.breakpoints(initial="100%", md="auto")
+_ID_BOX_WIDTH = rx.breakpoints(initial="100%", md="280px")
+
+
+_SESSION_ID_STYLE: Dict[str, Any] = {
+    "color": _ACCENT_CYAN,
+    "font_size": "13px",
+    "font_family": _MONO_FONT,
+    "padding": "6px 10px",
+    "background": _BG_TERTIARY,
+    "border_radius": "6px",
+    "letter_spacing": "-0.01em",
+    "width": _ID_BOX_WIDTH,
+    "flex": "0 0 auto",
+    "min_width": "0",
+}
 
 
 def session_panel() -> rx.Component:
     """Session controls and resume form."""
 
-    row_direction = rx.breakpoints(initial="column", md="row")
-    row_wrap = rx.breakpoints(initial="wrap", md="nowrap")
-    buttons_direction = rx.breakpoints(initial="column", md="row")
-    buttons_row_direction = rx.breakpoints(initial="column", md="row")
-    buttons_justify = rx.breakpoints(initial="start", md="end")
-    button_width = rx.breakpoints(initial="100%", md="auto")
-    id_box_width = rx.breakpoints(initial="100%", md="280px")
-    copy_container_width = rx.breakpoints(initial="100%", md="auto")
-    input_width = id_box_width
-
     session_id_display = rx.code(
-        rx.cond(
-            PlaygroundState.session_id != "",
-            PlaygroundState.session_id,
-            "Pending...",
-        ),
-        color=COLORS["accent_cyan"],
-        font_size="13px",
-        font_family="'Fira Code', 'Monaco', 'Courier New', monospace",
-        padding="6px 10px",
-        background=COLORS["bg_tertiary"],
-        border_radius="6px",
-        letter_spacing="-0.01em",
-        width=id_box_width,
-        flex="0 0 auto",
-        min_width="0",
+        # JS "||" falls back on the empty string without a comparison or component cond.
+        PlaygroundState.session_id | "Pending...",
+        **_SESSION_ID_STYLE,
     )
 
     resume_input = styled_input(
         placeholder="Enter an existing session ID",
         value=PlaygroundState.resume_session_input,
         on_change=PlaygroundState.update_resume_session_input,
-        font_family="'Fira Code', 'Monaco', 'Courier New', monospace",
+        font_family=_MONO_FONT,
         font_size="13px",
-        width=input_width,
+        width=_ID_BOX_WIDTH,
         flex="1 1 auto",
         min_width="0",
-        max_width=input_width,
+        max_width=_ID_BOX_WIDTH,
     )
 
     input_container = rx.flex(
         resume_input,
         width="100%",
-        justify=rx.breakpoints(initial="start", md="end"),
+        justify=_BUTTONS_JUSTIFY,
         align="stretch",
         style={"flex": "1 1 auto"},
     )
@@ -430,26 +543,26 @@ def session_panel() -> rx.Component:
         "Copy ID",
         color_scheme="cyan",
         on_click=PlaygroundState.copy_session_id,
-        width=button_width,
+        width=_AUTO_WIDTH,
     )
 
     resume_button = styled_button(
         "Resume",
         color_scheme="blue",
         on_click=PlaygroundState.resume_session,
-        width=button_width,
+        width=_AUTO_WIDTH,
     )
 
     new_session_button = styled_button(
         "New Session",
         color_scheme="purple",
         on_click=PlaygroundState.start_new_session,
-        width=button_width,
+        width=_AUTO_WIDTH,
     )
 
     copy_container = rx.flex(
         copy_button,
-        width=copy_container_width,
+        width=_AUTO_WIDTH,
         justify="start",
         align="stretch",
         wrap="wrap",
@@ -459,10 +572,10 @@ def session_panel() -> rx.Component:
     actions_container = rx.flex(
         resume_button,
         new_session_button,
-        direction=buttons_direction,
+        direction=_ROW_DIRECTION,
         gap="12px",
         width="100%",
-        justify=buttons_justify,
+        justify=_BUTTONS_JUSTIFY,
         align="stretch",
         wrap="wrap",
         style={"flex": "1 1 auto"},
@@ -471,7 +584,7 @@ def session_panel() -> rx.Component:
     buttons_row = rx.flex(
         copy_container,
         actions_container,
-        direction=buttons_row_direction,
+        direction=_ROW_DIRECTION,
         gap="12px",
         width="100%",
         align="stretch",
@@ -487,21 +600,19 @@ def session_panel() -> rx.Component:
             rx.flex(
                 session_id_display,
                 input_container,
-                direction=row_direction,
+                direction=_ROW_DIRECTION,
                 gap="12px",
                 width="100%",
                 align="stretch",
-                wrap=row_wrap,
+                wrap=_ROW_WRAP,
             ),
             buttons_row,
-            rx.cond(
-                PlaygroundState.session_error != "",
-                rx.text(
-                    PlaygroundState.session_error,
-                    color=COLORS["warning"],
-                    size="1",
-                ),
-                rx.fragment(),
+            # Keep the node mounted and toggle it with CSS; errors come and go often.
+            rx.text(
+                PlaygroundState.session_error,
+                color=_WARNING,
+                size="1",
+                display=rx.cond(PlaygroundState.session_error, "block", "none"),
             ),
             spacing="3",
             width="100%",
@@ -511,52 +622,36 @@ def session_panel() -> rx.Component:
 
 def styled_button(text: str, color_scheme: str = "blue", **kwargs) -> rx.Component:
     """Styled button with modern appearance."""
-    color_map = {
-        "purple": COLORS["accent_purple"],
-        "blue": COLORS["accent_blue"],
-        "cyan": COLORS["accent_cyan"],
-        "success": COLORS["success"],
-        "warning": COLORS["warning"],
-        "error": COLORS["error"],
-    }
-
-    bg_color = color_map.get(color_scheme, COLORS["accent_blue"])
-    return rx.button(
-        text,
-        background=bg_color,
-        color="white",
-        border="none",
-        border_radius="8px",
-        padding_x="20px",
-        padding_y="10px",
-        font_weight="500",
-        font_size="14px",
-        cursor="pointer",
-        transition="all 0.2s",
-        _hover={
-            "opacity": "0.9",
-            "transform": "translateY(-1px)",
-        },
-        **kwargs,
-    )
+    style = _BUTTON_STYLES.get(color_scheme, _BUTTON_STYLES["blue"])
+    return _with_style(rx.button, style, text, **kwargs)
 
 
 def styled_select(**kwargs) -> rx.Component:
     """Styled select dropdown with dark theme."""
-    default_style = {
-        "background": COLORS["bg_tertiary"],
-        "border": f"1px solid {COLORS['border']}",
-        "border_radius": "8px",
-        "color": COLORS["text_primary"],
-    }
-    return rx.select(**{**default_style, **kwargs})
+    return _with_style(rx.select, _SELECT_STYLE, **kwargs)
+
+
+# Per-field event specs, created once per environment key. The edit handler
+# is partially applied; Reflex appends the on_change value as its last arg.
+_EDIT_HANDLERS = {
+    field.key: PlaygroundState.edit_environment_value(field.key)
+    for field in ENVIRONMENT_FIELDS
+}
+_RESET_HANDLERS = {
+    field.key: PlaygroundState.reset_environment_value(field.key)
+    for field in ENVIRONMENT_FIELDS
+}
+_APPLY_HANDLERS = {
+    field.key: PlaygroundState.apply_environment_value(field.key)
+    for field in ENVIRONMENT_FIELDS
+}
 
 
-def environment_field_row(info: dict) -> rx.Component:
-    key = info.get("key", "")
-    label = info.get("label", key)
-    tooltip_text = info.get("tooltip", "")
-    placeholder = info.get("placeholder", "")
+def environment_field_row(info: EnvironmentField) -> rx.Component:
+    key = info.key
+    label = info.label
+    tooltip_text = info.tooltip
+    placeholder = info.placeholder
 
     badge = Badge.create(
         label,
@@ -579,18 +674,18 @@ def environment_field_row(info: dict) -> rx.Component:
         ),
         styled_input(
             value=PlaygroundState.environment_editor.get(key, ""),
-            on_change=lambda value, key=key: PlaygroundState.edit_environment_value(key, value),
+            on_change=_EDIT_HANDLERS[key],
             placeholder=placeholder,
         ),
         rx.flex(
             styled_button(
                 "Reset",
-                on_click=PlaygroundState.reset_environment_value(key),
+                on_click=_RESET_HANDLERS[key],
                 color_scheme="error",
             ),
             styled_button(
                 "Update",
-                on_click=PlaygroundState.apply_environment_value(key),
+                on_click=_APPLY_HANDLERS[key],
                 color_scheme="cyan",
             ),
             gap="12px",
@@ -602,8 +697,8 @@ def environment_field_row(info: dict) -> rx.Component:
         flex_direction="column",
         gap="12px",
         padding="16px",
-        background=COLORS["bg_tertiary"],
-        border=f"1px solid {COLORS['border_subtle']}",
+        background=_BG_TERTIARY,
+        border=_BORDER_SUBTLE,
         border_radius="8px",
     )
 
@@ -615,42 +710,46 @@ EXECUTE_HEIGHT = CARD_HEIGHT
 STATE_HEIGHT = CARD_HEIGHT
 
 
+def _expert_heading() -> rx.Component:
+    return rx.box(
+        rx.hstack(
+            rx.icon(
+                tag="settings",
+                size=18,
+                color=_TEXT_BLACK,
+            ),
+            rx.heading(
+                "Execution Environment Variables",
+                size="5",
+                color=_TEXT_BLACK,
+                font_weight="600",
+            ),
+            rx.spacer(),
+            align_items="center",
+            gap="8px",
+            width="100%",
+        ),
+        rx.text(
+            "Configure deterministic runtime context. Leave a field blank to fall back to live defaults.",
+            color=_TEXT_BLACK,
+            size="2",
+            line_height="1.6",
+            width="100%",
+            text_align="left",
+        ),
+        display="flex",
+        flex_direction="column",
+        gap="8px",
+        width="100%",
+    )
+
+
 def expert_section() -> rx.Component:
     return card(
         rx.accordion.root(
             rx.accordion.item(
                 header=rx.accordion.trigger(
-                    rx.box(
-                        rx.hstack(
-                            rx.icon(
-                                tag="settings",
-                                size=18,
-                                color=COLORS["text_black"],
-                            ),
-                            rx.heading(
-                                "Execution Environment Variables",
-                                size="5",
-                                color=COLORS["text_black"],
-                                font_weight="600",
-                            ),
-                            rx.spacer(),
-                            align_items="center",
-                            gap="8px",
-                            width="100%",
-                        ),
-                        rx.text(
-                            "Configure deterministic runtime context. Leave a field blank to fall back to live defaults.",
-                            color=COLORS["text_black"],
-                            size="2",
-                            line_height="1.6",
-                            width="100%",
-                            text_align="left",
-                        ),
-                        display="flex",
-                        flex_direction="column",
-                        gap="8px",
-                        width="100%",
-                    ),
+                    _expert_heading(),
                     padding_y="8px",
                     padding_x="12px",
                 ),
@@ -659,13 +758,13 @@ def expert_section() -> rx.Component:
                         rx.vstack(
                             rx.text(
                                 "Note: The environment variable 'caller' is managed by the runtime during contract-to-contract calls and cannot be overridden here.",
-                                color=COLORS["text_secondary"],
+                                color=_TEXT_SECONDARY,
                                 font_style="italic",
                                 size="1",
                                 line_height="1.6",
                             ),
                             rx.flex(
-                                *[environment_field_row(field) for field in ENVIRONMENT_FIELDS],
+                                *(environment_field_row(field) for field in ENVIRONMENT_FIELDS),
                                 wrap="wrap",
                                 spacing="3",
                                 width="100%",
@@ -674,8 +773,8 @@ def expert_section() -> rx.Component:
                             gap="16px",
                             width="100%",
                         ),
-                        background=COLORS["bg_secondary"],
-                        border=f"1px solid {COLORS['border']}",
+                        background=_BG_SECONDARY,
+                        border=_BORDER,
                         border_radius="8px",
                         padding="16px",
                     ),
@@ -692,66 +791,116 @@ def expert_section() -> rx.Component:
     )
 
 
-def editor_section(card_kwargs: Dict[str, Any] | None = None) -> rx.Component:
-    card_kwargs, is_fullscreen, _ = resolve_panel_context(card_kwargs, EDITOR_HEIGHT)
-    editor_height = "100%"
+# Kept as a plain dict: MonacoEditor.options is typed ``dict`` and Reflex
+# rejects mapping proxies for it. Treat it as read-only.
+_MONACO_OPTIONS: Dict[str, Any] = {
+    "automaticLayout": True,
+    "tabSize": 4,
+    "insertSpaces": True,
+    "scrollBeyondLastLine": False,
+    "wordWrap": "on",
+    "minimap": {"enabled": False},
+    "lineNumbers": "on",
+    "renderWhitespace": "selection",
+    "padding": {"top": 12, "bottom": 12},
+}
 
-    editor_container_kwargs: Dict[str, Any] = {
-        "width": "100%",
-        "display": "flex",
-        "flex": "1 1 auto",
-        "overflow": "hidden",
-        "min_height": "0",
-        "height": "100%",
-    }
-    if is_fullscreen:
-        editor_container_kwargs.update({"max_height": None})
 
-    lint_results_box = rx.cond(
-        PlaygroundState.lint_has_results,
-        rx.box(
-            rx.vstack(
-                rx.hstack(
-                    rx.icon(tag="triangle_alert", size=18, color=COLORS["warning"]),
-                    rx.heading(
-                        "Lint Findings",
-                        size="3",
-                        color=COLORS["warning"],
-                        font_weight="600",
-                    ),
-                    align_items="center",
-                    gap="8px",
-                    width="100%",
+_EDITOR_CONTAINER_STYLE: Dict[str, Any] = {
+    "width": "100%",
+    "display": "flex",
+    "flex": "1 1 auto",
+    "overflow": "hidden",
+    "min_height": "0",
+    "height": "100%",
+}
+_EDITOR_CONTAINER_FULL_STYLE: Dict[str, Any] = {
+    **_EDITOR_CONTAINER_STYLE,
+    "max_height": None,
+}
+
+
+def _lint_button() -> rx.Component:
+    """Run Linter button; the only editor control bound to the linting flag."""
+    return styled_button(
+        rx.cond(
+            PlaygroundState.linting,
+            "Linting...",
+            "Run Linter",
+        ),
+        on_click=PlaygroundState.lint_contract,
+        color_scheme="cyan",
+        disabled=PlaygroundState.linting,
+    )
+
+
+def _lint_results_box() -> rx.Component:
+    return rx.box(
+        rx.vstack(
+            rx.hstack(
+                rx.icon(tag="triangle_alert", size=18, color=_WARNING),
+                rx.heading(
+                    "Lint Findings",
+                    size="3",
+                    color=_WARNING,
+                    font_weight="600",
                 ),
-                rx.box(
-                    rx.vstack(
+                align_items="center",
+                gap="8px",
+                width="100%",
+            ),
+            rx.box(
+                rx.vstack(
+                    # Typical runs render the joined text; long runs get a row per finding.
+                    rx.cond(
+                        PlaygroundState.lint_short_results_text != "",
+                        rx.text(
+                            PlaygroundState.lint_short_results_text,
+                            color=_WARNING,
+                            size="2",
+                            white_space="pre-wrap",
+                        ),
                         rx.foreach(
                             PlaygroundState.lint_results,
                             lambda message: rx.text(
                                 message,
-                                color=COLORS["warning"],
+                                color=_WARNING,
                                 size="2",
                             ),
                         ),
-                        gap="8px",
-                        width="100%",
-                        align_items="start",
                     ),
-                    max_height="160px",
-                    overflow_y="auto",
+                    gap="8px",
                     width="100%",
+                    align_items="start",
                 ),
-                gap="12px",
+                max_height="160px",
+                overflow_y="auto",
                 width="100%",
-                align_items="stretch",
             ),
-            padding="12px",
-            border=f"1px solid {COLORS['border']}",
-            border_radius="8px",
-            background=COLORS["bg_tertiary"],
+            gap="12px",
             width="100%",
+            align_items="stretch",
         ),
-        rx.fragment(),
+        padding="12px",
+        border=_BORDER,
+        border_radius="8px",
+        background=_BG_TERTIARY,
+        width="100%",
+        # Toggle visibility instead of swapping subtrees; neither list renders
+        # anything while there are no findings.
+        display=rx.cond(PlaygroundState.lint_has_results, "block", "none"),
+    )
+
+
+def editor_section(
+    card_kwargs: Dict[str, Any] | None = None,
+    *,
+    is_fullscreen: bool = False,
+) -> rx.Component:
+    card_kwargs = card_kwargs or {}
+    editor_height = "100%"
+    editor_container_kwargs = (
+        _EDITOR_CONTAINER_FULL_STYLE if is_fullscreen else _EDITOR_CONTAINER_STYLE
     )
 
     return card(
@@ -774,17 +923,9 @@ def editor_section(card_kwargs: Dict[str, Any] | None = None) -> rx.Component:
                     language="python",
                     theme="vs-dark",
                     height=editor_height,
-                    options={
-                        "automaticLayout": True,
-                        "tabSize": 4,
-                        "insertSpaces": True,
-                        "scrollBeyondLastLine": False,
-                        "wordWrap": "on",
-                        "minimap": {"enabled": False},
-                        "lineNumbers": "on",
-                        "renderWhitespace": "selection",
-                        "padding": {"top": 12, "bottom": 12},
-                    },
+                    options=_MONACO_OPTIONS,
+                    # Not debounced: Deploy/Save/Lint read code_editor, and a delayed
+                    # update could land after them (or after a programmatic load).
                     on_change=PlaygroundState.update_code,
                     key=PlaygroundState.code_editor_revision,
                     class_name="playground-monaco",
@@ -803,20 +944,11 @@ def editor_section(card_kwargs: Dict[str, Any] | None = None) -> rx.Component:
                     on_click=PlaygroundState.deploy_contract,
                     color_scheme="purple",
                 ),
-                styled_button(
-                    rx.cond(
-                        PlaygroundState.linting,
-                        "Linting...",
-                        "Run Linter",
-                    ),
-                    on_click=PlaygroundState.lint_contract,
-                    color_scheme="cyan",
-                    disabled=PlaygroundState.linting,
-                ),
+                _lint_button(),
                 width="100%",
                 spacing="3",
             ),
-            lint_results_box,
+            _lint_results_box(),
             base_height=EDITOR_HEIGHT,
             is_fullscreen=is_fullscreen,
         ),
@@ -824,8 +956,26 @@ def editor_section(card_kwargs: Dict[str, Any] | None = None) -> rx.Component:
     )
 
 
-def load_section(card_kwargs: Dict[str, Any] | None = None) -> rx.Component:
-    card_kwargs, is_fullscreen, _ = resolve_panel_context(card_kwargs, LOAD_VIEW_HEIGHT)
+_LOAD_VIEWER_STYLE: Dict[str, Any] = {
+    "maxWidth": "100%",
+    "background": _BG_TERTIARY,
+    "border": _BORDER,
+    "borderRadius": "8px",
+    "padding": "12px",
+    "overflow": "auto",
+}
+_LOAD_VIEWER_FULL_STYLE: Dict[str, Any] = {
+    **_LOAD_VIEWER_STYLE,
+    "height": "100%",
+}
+
+
+def load_section(
+    card_kwargs: Dict[str, Any] | None = None,
+    *,
+    is_fullscreen: bool = False,
+) -> rx.Component:
+    card_kwargs = card_kwargs or {}
 
     viewer_stack_style: Dict[str, Any] = {
         "display": "flex",
@@ -836,42 +986,27 @@ def load_section(card_kwargs: Dict[str, Any] | None = None) -> rx.Component:
         "width": "100%",
     }
 
-    def _code_viewer_style(is_full: bool) -> Dict[str, Any]:
-        style: Dict[str, Any] = {
-            "maxWidth": "100%",
-            "background": COLORS["bg_tertiary"],
-            "border": f"1px solid {COLORS['border']}",
-            "borderRadius": "8px",
-            "padding": "12px",
-            "overflow": "auto",
-        }
-        if is_full:
-            style.update(
-                {
-                    "height": "100%",
-                }
-            )
-        return style
-
     load_panel = panel_stack(
         styled_select(
             items=PlaygroundState.deployed_contracts,
             value=PlaygroundState.load_selected_contract,
             placeholder="Select a contract",
             on_change=PlaygroundState.change_loaded_contract,
-            disabled=PlaygroundState.deployed_contracts == [],
+            # Truthiness compiles to isTrue(), which checks array length; a JS
+            # "=== []" comparison is never true.
+            disabled=~PlaygroundState.deployed_contracts,
             width="100%",
         ),
         rx.cond(
-            PlaygroundState.load_selected_contract == "",
+            ~PlaygroundState.load_selected_contract,
             rx.box(
                 rx.text(
                     "Select a deployed contract to review its source and exports.",
-                    color=COLORS["text_muted"],
+                    color=_TEXT_MUTED,
                     size="2",
                 ),
                 padding="12px",
-                border=f"1px dashed {COLORS['border']}",
+                border=f"1px dashed {_BORDER_COLOR}",
                 border_radius="8px",
             ),
             rx.box(
@@ -882,7 +1017,7 @@ def load_section(card_kwargs: Dict[str, Any] | None = None) -> rx.Component:
                             "Decompiled",
                             "Raw",
                         ),
-                        color=COLORS["text_secondary"],
+                        color=_TEXT_SECONDARY,
                         size="2",
                     ),
                     rx.spacer(),
@@ -897,24 +1032,22 @@ def load_section(card_kwargs: Dict[str, Any] | None = None) -> rx.Component:
                     flex_wrap="wrap",
                 ),
                 rx.box(
-                    rx.cond(
-                        PlaygroundState.load_view_decompiled,
-                        code_viewer(
+                    # Pick the source as a value, so only one code block is rendered.
+                    code_viewer(
+                        rx.cond(
+                            PlaygroundState.load_view_decompiled,
                             PlaygroundState.loaded_contract_decompiled,
-                            "python",
-                            "# Decompiled source unavailable.",
-                            font_size="12px",
-                            boxed=False,
-                            style=_code_viewer_style(is_fullscreen),
-                        ),
-                        code_viewer(
                             PlaygroundState.loaded_contract_code,
-                            "python",
+                        ),
+                        "python",
+                        rx.cond(
+                            PlaygroundState.load_view_decompiled,
+                            "# Decompiled source unavailable.",
                             "# Source unavailable.",
-                            font_size="12px",
-                            boxed=False,
-                            style=_code_viewer_style(is_fullscreen),
                         ),
+                        font_size="12px",
+                        boxed=False,
+                        style=_LOAD_VIEWER_FULL_STYLE if is_fullscreen else _LOAD_VIEWER_STYLE,
                     ),
                     flex="1 1 auto",
                     min_height="0",
@@ -926,7 +1059,7 @@ def load_section(card_kwargs: Dict[str, Any] | None = None) -> rx.Component:
                     "Remove Contract",
                     on_click=PlaygroundState.remove_selected_contract,
                     color_scheme="error",
-                    disabled=PlaygroundState.load_selected_contract == "",
+                    disabled=~PlaygroundState.load_selected_contract,
                     width="100%",
                     margin_top="auto",
                 ),
@@ -949,62 +1082,73 @@ def load_section(card_kwargs: Dict[str, Any] | None = None) -> rx.Component:
     )
 
 
+_KWARGS_TEXTAREA_PROPS: Dict[str, Any] = {
+    "placeholder": 'Kwargs as JSON, e.g. {"to": "alice", "amount": 25}',
+    "font_family": _MONO_FONT,
+    "class_name": "playground-kwargs-textarea",
+    "spell_check": False,
+    "min_height": "120px",
+    "height": "100%",
+}
+_KWARGS_CONTAINER_PROPS: Dict[str, Any] = {
+    "width": "100%",
+    "flex": "1 1 auto",
+    "min_height": "120px",
+    "overflow": "hidden",
+    "display": "flex",
+    "flex_direction": "column",
+}
+_RESULT_VIEWER_STYLE: Dict[str, Any] = {
+    "width": "100%",
+    "fontSize": "12px",
+    "maxHeight": "300px",
+    "overflow": "auto",
+    "border": _BORDER,
+    "borderRadius": "8px",
+    "padding": "12px",
+    "background": _BG_TERTIARY,
+}
+_RESULT_VIEWER_FULL_STYLE: Dict[str, Any] = {
+    **_RESULT_VIEWER_STYLE,
+    "maxHeight": "50vh",
+}
 
-def execution_section(card_kwargs: Dict[str, Any] | None = None) -> rx.Component:
-    card_kwargs, is_fullscreen, _ = resolve_panel_context(card_kwargs, EXECUTE_HEIGHT)
 
+def _result_header() -> rx.Component:
+    return rx.hstack(
+        rx.icon(tag="terminal", size=18, color=_ACCENT_CYAN),
+        rx.heading(
+            "Result",
+            size="3",
+            color=_TEXT_PRIMARY,
+            font_weight="600",
+        ),
+        align_items="center",
+        gap="8px",
+        width="100%",
+    )
 
-    textarea_kwargs: Dict[str, Any] = {
-        "placeholder": 'Kwargs as JSON, e.g. {"to": "alice", "amount": 25}',
-        "value": PlaygroundState.kwargs_input,
-        "on_change": PlaygroundState.update_kwargs,
-        "font_family": "'Fira Code', 'Monaco', 'Courier New', monospace",
-        "class_name": "playground-kwargs-textarea",
-        "spell_check": False,
-        "min_height": "120px",
-        "height": "100%",
-    }
-    textarea_container_props: Dict[str, Any] = {
-        "width": "100%",
-        "flex": "1 1 auto",
-        "min_height": "120px",
-        "overflow": "hidden",
-        "display": "flex",
-        "flex_direction": "column",
-    }
 
-    result_view = rx.cond(
-        PlaygroundState.run_result == "",
-        rx.fragment(),
+def execution_section(
+    card_kwargs: Dict[str, Any] | None = None,
+    *,
+    is_fullscreen: bool = False,
+) -> rx.Component:
+    card_kwargs = card_kwargs or {}
+
+
+    result_view = maybe(
+        PlaygroundState.run_result != "",
         rx.vstack(
-            rx.hstack(
-                rx.icon(tag="terminal", size=18, color=COLORS["accent_cyan"]),
-                rx.heading(
-                    "Result",
-                    size="3",
-                    color=COLORS["text_primary"],
-                    font_weight="600",
-                ),
-                align_items="center",
-                gap="8px",
-                width="100%",
-            ),
+            _result_header(),
             code_viewer(
                 PlaygroundState.run_result,
                 "json",
                 "Awaiting execution...",
                 font_size="12px",
                 boxed=False,
-                style={
-                    "width": "100%",
-                    "fontSize": "12px",
-                    "maxHeight": "50vh" if is_fullscreen else "300px",
-                    "overflow": "auto",
-                    "border": f"1px solid {COLORS['border']}",
-                    "borderRadius": "8px",
-                    "padding": "12px",
-                    "background": COLORS["bg_tertiary"],
-                },
+                style=_RESULT_VIEWER_FULL_STYLE if is_fullscreen else _RESULT_VIEWER_STYLE,
+                plain_over=CODE_HIGHLIGHT_MAX_CHARS,
             ),
             spacing="3",
             width="100%",
@@ -1034,8 +1178,12 @@ def execution_section(card_kwargs: Dict[str, Any] | None = None) -> rx.Component
                 width="100%",
             ),
             rx.box(
-                styled_text_area(**textarea_kwargs),
-                **textarea_container_props,
+                styled_text_area(
+                    value=PlaygroundState.kwargs_input,
+                    on_change=PlaygroundState.update_kwargs,
+                    **_KWARGS_TEXTAREA_PROPS,
+                ),
+                **_KWARGS_CONTAINER_PROPS,
             ),
             rx.box(
                 styled_button(
@@ -1058,9 +1206,8 @@ def execution_section(card_kwargs: Dict[str, Any] | None = None) -> rx.Component
 def log_section() -> rx.Component:
     body_height = "360px"
 
-    clear_button_row = rx.cond(
-        PlaygroundState.log_entries == [],
-        rx.fragment(),
+    clear_button_row = maybe(
+        PlaygroundState.log_entries.bool(),
         rx.hstack(
             rx.spacer(),
             styled_button(
@@ -1074,26 +1221,23 @@ def log_section() -> rx.Component:
     )
 
     log_entries_content = rx.cond(
-        PlaygroundState.log_entries == [],
+        ~PlaygroundState.log_entries,
         rx.text(
             "Actions you run will appear here with the latest at the bottom.",
-            color=COLORS["text_secondary"],
+            color=_TEXT_SECONDARY,
             size="2",
         ),
         rx.box(
             rx.vstack(
-                rx.foreach(
-                    PlaygroundState.log_entries,
-                    lambda entry, idx: log_entry_item(entry),
-                ),
+                rx.foreach(PlaygroundState.log_entries, log_entry_item),
                 gap="12px",
                 width="100%",
             ),
             max_height=body_height,
             overflow="auto",
             width="100%",
-            background=COLORS["bg_tertiary"],
-            border=f"1px solid {COLORS['border']}",
+            background=_BG_TERTIARY,
+            border=_BORDER,
             border_radius="12px",
             padding="12px",
         ),
@@ -1111,11 +1255,11 @@ def log_section() -> rx.Component:
 
     header = rx.hstack(
         rx.hstack(
-            rx.icon(tag="list", size=18, color=COLORS["text_black"]),
+            rx.icon(tag="list", size=18, color=_TEXT_BLACK),
             rx.heading(
                 "Activity Log",
                 size="5",
-                color=COLORS["text_black"],
+                color=_TEXT_BLACK,
                 font_weight="600",
             ),
             align_items="center",
@@ -1129,7 +1273,7 @@ def log_section() -> rx.Component:
 
     description = rx.text(
         "Recent deployments, executions, and state mutations.",
-        color=COLORS["text_black"],
+        color=_TEXT_BLACK,
         size="2",
         line_height="1.6",
         width="100%",
@@ -1162,36 +1306,43 @@ def log_section() -> rx.Component:
         ),
     )
 
+_STATE_VIEWER_STYLE: Dict[str, Any] = {
+    "flex": "1 1 auto",
+    "width": "100%",
+    "overflow": "auto",
+    "minHeight": "0",
+    "background": _BG_TERTIARY,
+    "border": _BORDER,
+    "borderRadius": "8px",
+    "padding": "12px",
+}
+_STATE_VIEWER_FULL_STYLE: Dict[str, Any] = {
+    **_STATE_VIEWER_STYLE,
+    "height": "100%",
+}
+_UPLOAD_STYLE: Dict[str, Any] = {
+    "display": "inline-flex",
+    "border": "none",
+    "padding": "0",
+    "background": "transparent",
+}
 
-def state_section(card_kwargs: Dict[str, Any] | None = None) -> rx.Component:
-    card_kwargs, is_fullscreen, _ = resolve_panel_context(card_kwargs, STATE_HEIGHT)
 
-    inner_panel_style: Dict[str, Any] = {
-        "flex": "1 1 auto",
-        "width": "100%",
-        "overflow": "auto",
-        "minHeight": "0",
-        "background": COLORS["bg_tertiary"],
-        "border": f"1px solid {COLORS['border']}",
-        "borderRadius": "8px",
-        "padding": "12px",
-    }
+def state_section(
+    card_kwargs: Dict[str, Any] | None = None,
+    *,
+    is_fullscreen: bool = False,
+) -> rx.Component:
+    card_kwargs = card_kwargs or {}
 
-    viewer_style: Dict[str, Any] = {
-        **inner_panel_style,
-        "width": "100%",
-        "flex": "1 1 auto",
-        "minHeight": "0",
-    }
-    if is_fullscreen:
-        viewer_style["height"] = "100%"
+    viewer_style = _STATE_VIEWER_FULL_STYLE if is_fullscreen else _STATE_VIEWER_STYLE
 
     viewer_content = rx.cond(
         PlaygroundState.state_is_editing,
         styled_text_area(
             value=PlaygroundState.state_editor,
             on_change=PlaygroundState.update_state_editor,
-            font_family="'Fira Code', 'Monaco', 'Courier New', monospace",
+            font_family=_MONO_FONT,
             overflow_y="auto",
             spell_check=False,
             height="100%" if is_fullscreen else "auto",
@@ -1204,6 +1355,7 @@ def state_section(card_kwargs: Dict[str, Any] | None = None) -> rx.Component:
             font_size="12px",
             boxed=False,
             style=viewer_style,
+            plain_over=CODE_HIGHLIGHT_MAX_CHARS,
         ),
     )
 
@@ -1216,7 +1368,7 @@ def state_section(card_kwargs: Dict[str, Any] | None = None) -> rx.Component:
             ),
             rx.text(
                 "Show protected state keys",
-                color=COLORS["text_primary"],
+                color=_TEXT_PRIMARY,
                 size="2",
                 cursor="pointer",
                 on_click=PlaygroundState.toggle_show_internal_state,
@@ -1289,8 +1441,8 @@ def state_section(card_kwargs: Dict[str, Any] | None = None) -> rx.Component:
                         align_items="stretch",
                     ),
                     max_width="420px",
-                    background=COLORS["bg_secondary"],
-                    border=f"1px solid {COLORS['border']}",
+                    background=_BG_SECONDARY,
+                    border=_BORDER,
                     border_radius="12px",
                     padding="24px",
                 ),
@@ -1311,12 +1463,7 @@ def state_section(card_kwargs: Dict[str, Any] | None = None) -> rx.Component:
                 max_files=1,
                 on_drop=PlaygroundState.import_state,
                 no_drag=True,
-                style={
-                    "display": "inline-flex",
-                    "border": "none",
-                    "padding": "0",
-                    "background": "transparent",
-                },
+                style=_UPLOAD_STYLE,
                 class_name="playground-upload",
             ),
             spacing="3",
@@ -1340,16 +1487,23 @@ def state_section(card_kwargs: Dict[str, Any] | None = None) -> rx.Component:
     )
 
 
-def fullscreen_overlay() -> rx.Component:
-    fullscreen_card_props = {
-        "height": "100%",
-        "min_height": "0",
-        "flex": "1 1 auto",
-        "display": "flex",
-        "flex_direction": "column",
-        "class_name": "fullscreen-card",
-    }
+_FULLSCREEN_SECTIONS: Dict[str, Callable[..., rx.Component]] = {
+    "write": editor_section,
+    "load": load_section,
+    "execute": execution_section,
+    "state": state_section,
+}
+_FULLSCREEN_CARD_PROPS: Dict[str, Any] = {
+    "height": "100%",
+    "min_height": "0",
+    "flex": "1 1 auto",
+    "display": "flex",
+    "flex_direction": "column",
+    "class_name": "fullscreen-card",
+}
+
 
+def fullscreen_overlay() -> rx.Component:
     def _render_overlay(content: rx.Component) -> rx.Component:
         return rx.fragment(
             rx.window_event_listener(
@@ -1360,7 +1514,7 @@ def fullscreen_overlay() -> rx.Component:
                 position="fixed",
                 inset="0",
                 padding=["16px", "24px", "32px"],
-                background=COLORS["bg_primary"],
+                background=_BG_PRIMARY,
                 min_height="100vh",
                 height="100vh",
                 display="flex",
@@ -1371,23 +1525,18 @@ def fullscreen_overlay() -> rx.Component:
             ),
         )
 
-    return rx.cond(
-        PlaygroundState.expanded_panel == "write",
-        _render_overlay(editor_section(card_kwargs=fullscreen_card_props)),
-        rx.cond(
-            PlaygroundState.expanded_panel == "load",
-            _render_overlay(load_section(card_kwargs=fullscreen_card_props)),
-            rx.cond(
-                PlaygroundState.expanded_panel == "execute",
-                _render_overlay(execution_section(card_kwargs=fullscreen_card_props)),
-                rx.cond(
-                    PlaygroundState.expanded_panel == "state",
-                    _render_overlay(state_section(card_kwargs=fullscreen_card_props)),
-                    rx.fragment(),
-                ),
+    # Fold the table into a cond chain, innermost branch first; with only a
+    # handful of panels the client evaluates at most a few string compares.
+    overlay: rx.Component = rx.fragment()
+    for panel_id, builder in reversed(_FULLSCREEN_SECTIONS.items()):
+        overlay = rx.cond(
+            PlaygroundState.expanded_panel == panel_id,
+            _render_overlay(
+                builder(card_kwargs=_FULLSCREEN_CARD_PROPS, is_fullscreen=True)
             ),
-        ),
-    )
+            overlay,
+        )
+    return overlay
 
 
 def not_found_page() -> rx.Component:
@@ -1417,11 +1566,11 @@ def not_found_page() -> rx.Component:
                 rx.heading(
                     "404 – Page Not Found",
                     size="7",
-                    color=COLORS["text_primary"],
+                    color=_TEXT_PRIMARY,
                 ),
                 rx.text(
                     message,
-                    color=COLORS["text_secondary"],
+                    color=_TEXT_SECONDARY,
                     text_align="center",
                     line_height="1.7",
                 ),
@@ -1447,16 +1596,16 @@ def not_found_page() -> rx.Component:
             ),
             width="100%",
             max_width="520px",
-            background=COLORS["bg_secondary"],
+            background=_BG_SECONDARY,
             padding="40px",
             border_radius="20px",
-            border=f"1px solid {COLORS['border']}",
+            border=_BORDER,
             box_shadow="0 35px 80px rgba(0, 0, 0, 0.55)",
             gap="6",
         ),
         min_height="100vh",
         width="100%",
-        background=COLORS["bg_primary"],
+        background=_BG_PRIMARY,
         display="flex",
         align_items="center",
         justify_content="center",
@@ -1473,14 +1622,14 @@ def header() -> rx.Component:
                     rx.heading(
                         "Xian",
                         size="8",
-                        color=COLORS["text_primary"],
+                        color=_TEXT_PRIMARY,
                         font_weight="700",
                         letter_spacing="-0.02em",
                     ),
                     rx.heading(
                         "Contracting Playground",
                         size="8",
-                        background=f"linear-gradient(135deg, {COLORS['accent_purple']} 0%, {COLORS['accent_cyan']} 100%)",
+                        background=_TITLE_GRADIENT,
                         background_clip="text",
                         color="transparent",
                         font_weight="700",
@@ -1496,7 +1645,7 @@ def header() -> rx.Component:
         ),
         rx.text(
             "Deploy Python smart contracts, execute exported functions, and inspect resulting state without leaving the browser.",
-            color=COLORS["text_secondary"],
+            color=_TEXT_SECONDARY,
             size="3",
             line_height="1.6",
         ),
@@ -1531,32 +1680,15 @@ def index() -> rx.Component:
             rx.box(
                 rx.vstack(
                     session_panel(),
-                    # Main content grid - Editor and Execution side by side
-                    rx.box(
-                        rx.grid(
-                            _maybe_render_panel("write", editor_section()),
-                            _maybe_render_panel("load", load_section()),
-                            _maybe_render_panel("execute", execution_section()),
-                            _maybe_render_panel("state", state_section()),
-                            columns="2",
-                            spacing="5",
-                            width="100%",
-                        ),
-                        width="100%",
-                        display=["none", "none", "block"],  # Hide on mobile
-                    ),
-                    # Mobile stack layout
-                    rx.box(
-                        rx.vstack(
-                            _maybe_render_panel("write", editor_section()),
-                            _maybe_render_panel("load", load_section()),
-                            _maybe_render_panel("execute", execution_section()),
-                            _maybe_render_panel("state", state_section()),
-                            spacing="5",
-                            width="100%",
-                        ),
+                    # Main content grid - single column on mobile, two on desktop
+                    rx.grid(
+                        _maybe_render_panel("write", editor_section()),
+                        _maybe_render_panel("load", load_section()),
+                        _maybe_render_panel("execute", execution_section()),
+                        _maybe_render_panel("state", state_section()),
+                        columns=rx.breakpoints(initial="1", sm="2"),
+                        spacing="5",
                         width="100%",
-                        display=["block", "block", "none"],  # Show on mobile
                     ),
                     # Full width expert + log sections
                     expert_section(),
@@ -1574,7 +1706,7 @@ def index() -> rx.Component:
             width="100%",
         ),
         fullscreen_overlay(),
-        background=COLORS["bg_primary"],
+        background=_BG_PRIMARY,
         min_height="100vh",
         width="100%",
     )
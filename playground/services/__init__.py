@@ -6,6 +6,7 @@ from typing import Any
 __all__ = [
     "ContractingService",
     "ENVIRONMENT_FIELDS",
+    "EnvironmentField",
     "DEFAULT_SIGNER",
     "DEFAULT_ENVIRONMENT",
     "ContractDetails",
@@ -25,6 +26,7 @@ _EXPORT_MAP = {
     "contracting": {
         "ContractingService",
         "ENVIRONMENT_FIELDS",
+        "EnvironmentField",
         "DEFAULT_SIGNER",
         "DEFAULT_ENVIRONMENT",
         "ContractDetails",
@@ -2,13 +2,16 @@ from __future__ import annotations
 
 import ast
 import decimal
+import hashlib
 import json
+import math
 import re
+import shutil
 import threading
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, List, Tuple
 
 from contracting import constants
 from contracting.client import ContractingClient
@@ -20,6 +23,11 @@ from xian_py.decompiler import ContractDecompiler
 
 from .environment import stringify_environment_value
 
+try:  # Optional: orjson is much faster at encoding large state dumps.
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
 
 DEFAULT_SIGNER = "demo"
 DEFAULT_ENVIRONMENT: Dict[str, str] = {
@@ -29,45 +37,54 @@ DEFAULT_ENVIRONMENT: Dict[str, str] = {
     "block_hash": "0xabc...",
 }
 
-ENVIRONMENT_FIELDS: List[Dict[str, str]] = [
-    {
-        "key": "signer",
-        "label": "signer",
-        "tooltip": (
+@dataclass(frozen=True, slots=True)
+class EnvironmentField:
+    key: str
+    label: str
+    tooltip: str
+    placeholder: str
+
+
+ENVIRONMENT_FIELDS: Tuple[EnvironmentField, ...] = (
+    EnvironmentField(
+        key="signer",
+        label="signer",
+        tooltip=(
             "Override ctx.signer for executions. Typically this is the Xian wallet "
             "address submitting the transaction; leave blank to keep the default signer."
         ),
-        "placeholder": DEFAULT_SIGNER,
-    },
-    {
-        "key": "now",
-        "label": "now",
-        "tooltip": "Override the execution timestamp returned by ctx.now. Use ISO 8601 input such as 2024-02-01T12:30:00.",
-        "placeholder": DEFAULT_ENVIRONMENT["now"],
-    },
-    {
-        "key": "block_num",
-        "label": "block_num",
-        "tooltip": "Synthetic block height applied when seeding deterministic randomness.",
-        "placeholder": DEFAULT_ENVIRONMENT["block_num"],
-    },
-    {
-        "key": "block_hash",
-        "label": "block_hash",
-        "tooltip": "Block hash string mixed into the randomness seed.",
-        "placeholder": DEFAULT_ENVIRONMENT["block_hash"],
-    },
-]
-
-_ENVIRONMENT_LOOKUP = {field["key"]: field for field in ENVIRONMENT_FIELDS}
+        placeholder=DEFAULT_SIGNER,
+    ),
+    EnvironmentField(
+        key="now",
+        label="now",
+        tooltip="Override the execution timestamp returned by ctx.now. Use ISO 8601 input such as 2024-02-01T12:30:00.",
+        placeholder=DEFAULT_ENVIRONMENT["now"],
+    ),
+    EnvironmentField(
+        key="block_num",
+        label="block_num",
+        tooltip="Synthetic block height applied when seeding deterministic randomness.",
+        placeholder=DEFAULT_ENVIRONMENT["block_num"],
+    ),
+    EnvironmentField(
+        key="block_hash",
+        label="block_hash",
+        tooltip="Block hash string mixed into the randomness seed.",
+        placeholder=DEFAULT_ENVIRONMENT["block_hash"],
+    ),
+)
+
+_ENVIRONMENT_LOOKUP = {field.key: field for field in ENVIRONMENT_FIELDS}
+
+
+_DEFAULT_STORAGE_HOME = Path(__file__).resolve().parent.parent / ".contract_state"
 
 
 def _default_storage_home() -> Path:
     """Return the storage directory used by the in-app client."""
-    root = Path(__file__).resolve().parent.parent
-    storage = root / ".contract_state"
-    storage.mkdir(parents=True, exist_ok=True)
-    return storage
+    _DEFAULT_STORAGE_HOME.mkdir(parents=True, exist_ok=True)
+    return _DEFAULT_STORAGE_HOME
 
 
 _CONTRACT_NAME_PATTERN = re.compile(r"^[A-Za-z0-9_]{1,64}$")
@@ -79,34 +96,116 @@ def _valid_contract_name(name: str) -> bool:
     return bool(_CONTRACT_NAME_PATTERN.fullmatch(name))
 
 
+_EXPORT_NAMES = frozenset({"export", "__export"})
+# Cheap textual check for an `@export` / `@__export` / `@module.export` line.
+_EXPORT_MARKER = re.compile(r"^[ \t]*@[ \t]*(?:\w+[ \t]*\.[ \t]*)*(?:__)?export\b", re.MULTILINE)
+
+
 def _is_export_decorator(node: ast.AST) -> bool:
     """Return True if the decorator node represents `@export`."""
-    if isinstance(node, ast.Name):
-        return node.id in {"export", "__export"}
-    if isinstance(node, ast.Attribute):
-        return node.attr in {"export", "__export"}
-    if isinstance(node, ast.Call):
+    kind = type(node)
+    if kind is ast.Name:
+        return node.id in _EXPORT_NAMES
+    if kind is ast.Attribute:
+        return node.attr in _EXPORT_NAMES
+    if kind is ast.Call:
         return _is_export_decorator(node.func)
     return False
 
 
+_JSON_SCALAR_TYPES = frozenset({str, int, float, bool, type(None)})
+_SERIALIZERS: Dict[type, Callable[[Any], Any]] = {
+    ContractingDecimal: str,
+    decimal.Decimal: str,
+    Datetime: str,
+    bytes: bytes.hex,
+}
+_SEQUENCE_TYPES = (list, tuple, set)
+
+
+def _serialize_scalar(value: Any) -> Any:
+    kind = type(value)
+    if kind in _JSON_SCALAR_TYPES:
+        return value
+    handler = _SERIALIZERS.get(kind)
+    if handler is not None:
+        return handler(value)
+    # Subclasses miss the exact-type lookup; fall back to isinstance.
+    for base, handler in _SERIALIZERS.items():
+        if isinstance(value, base):
+            return handler(value)
+    return value
+
+
 def _serialize_value(value: Any) -> Any:
     """Convert contracting values to JSON-serializable primitives."""
-    if isinstance(value, ContractingDecimal):
-        return str(value)
-    if isinstance(value, decimal.Decimal):
-        return str(value)
-    if isinstance(value, Datetime):
-        return str(value)
-    if isinstance(value, bytes):
-        return value.hex()
+    if not isinstance(value, (dict, *_SEQUENCE_TYPES)):
+        return _serialize_scalar(value)
+
+    # Walk nested containers with an explicit stack; each entry names the slot
+    # in an output container that the converted value belongs in.
+    root: List[Any] = [None]
+    stack: List[Tuple[Any, Any, Any]] = [(root, 0, value)]
+    while stack:
+        target, slot, raw = stack.pop()
+        if isinstance(raw, dict):
+            # Keys that stringify alike keep the last value, as a comprehension would.
+            items = {str(k): v for k, v in raw.items()}
+            converted: Any = dict.fromkeys(items)
+            stack.extend((converted, k, v) for k, v in items.items())
+        elif isinstance(raw, _SEQUENCE_TYPES):
+            converted = [None] * len(raw)
+            stack.extend((converted, idx, v) for idx, v in enumerate(raw))
+        else:
+            converted = _serialize_scalar(raw)
+        target[slot] = converted
+    return root[0]
+
+
+def _finite(value: Any) -> Any:
+    """Replace NaN/Infinity floats with None, as orjson encodes them."""
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
     if isinstance(value, dict):
-        return {str(k): _serialize_value(v) for k, v in value.items()}
-    if isinstance(value, (list, tuple, set)):
-        return [_serialize_value(v) for v in value]
+        return {key: _finite(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_finite(item) for item in value]
     return value
 
 
+def _dumps(data: Any) -> str:
+    """Pretty-print ``data`` as sorted, 2-space indented JSON.
+
+    The stdlib fallback is pinned to orjson's output: raw UTF-8 instead of
+    ``\\u`` escapes, and ``null`` for non-finite floats.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                data, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS
+            ).decode("utf-8")
+        except TypeError:
+            # orjson rejects integers beyond 64 bits; let json handle those.
+            pass
+    try:
+        return json.dumps(data, indent=2, sort_keys=True, ensure_ascii=False, allow_nan=False)
+    except ValueError:
+        # Only non-finite floats get here; the extra pass is paid just then.
+        return json.dumps(_finite(data), indent=2, sort_keys=True, ensure_ascii=False)
+
+
+def _read_state_file(path: Path) -> Dict[str, Any]:
+    """Read every stored key/value pair from an HDF5 state file."""
+    return {
+        key: value
+        for key in hdf5.get_all_keys_from_file(str(path))
+        if (value := hdf5.get_value_from_disk(
+            str(path),
+            key.replace(constants.DELIMITER, constants.HDF5_GROUP_SEPARATOR),
+        )) is not None
+    }
+
+
 @dataclass
 class ContractingCallResult:
     result: Any
@@ -116,7 +215,7 @@ class ContractingCallResult:
             return "Success (no return value)"
         serialized = _serialize_value(self.result)
         if isinstance(serialized, (dict, list)):
-            return json.dumps(serialized, indent=2, sort_keys=True)
+            return _dumps(serialized)
         return str(serialized)
 
 
@@ -147,8 +246,17 @@ class ContractingService:
     def __init__(self, storage_home: Path | None = None):
         storage_home = storage_home or _default_storage_home()
         self._storage_home = storage_home
-        self._lock = threading.RLock()
+        self._lock = threading.Lock()
+        # contract name -> (source digest, parsed exports)
+        self._exports_cache: Dict[str, Tuple[bytes, List[ContractExportInfo]]] = {}
+        self._exports_dir = storage_home / "exports"
+        # Bumped by every committed write; a cached dump is only valid for the
+        # version it was taken at.
+        self._state_version = 0
+        # ((show_internal, state version), JSON) of the most recent dump
+        self._state_dump_cache: Tuple[Tuple[bool, int], str] | None = None
         self._driver = Driver(storage_home=storage_home)
+        self._contract_state_dir = self._driver.contract_state
         self._client = ContractingService._create_client(driver=self._driver)
         self._environment = self._client.environment
         self._apply_default_environment()
@@ -159,8 +267,8 @@ class ContractingService:
         return ContractingClient(driver=driver, signer=DEFAULT_SIGNER)
 
     def get_signer(self) -> str:
-        with self._lock:
-            return self._client.signer
+        # A single attribute read is atomic; no lock needed.
+        return self._client.signer
 
     def set_signer(self, signer: str) -> str:
         clean = (signer or "").strip()
@@ -197,8 +305,8 @@ class ContractingService:
         """Restore signer/environment overrides from a serialized snapshot."""
         if not snapshot:
             return
-        for key in ENVIRONMENT_FIELDS:
-            name = key["key"]
+        for field in ENVIRONMENT_FIELDS:
+            name = field.key
             value = snapshot.get(name)
             if value is None or str(value).strip() == "":
                 continue
@@ -313,6 +421,30 @@ class ContractingService:
 
     def deploy(self, name: str, code: str) -> None:
         """Deploy a contract by name."""
+        clean_name = self._validate_deploy(name, code)
+
+        with self._lock:
+            source = self._deploy_locked(clean_name, code)
+        if source:
+            # Parse once now so later reads come straight from the sidecar index.
+            self._exports_for(clean_name, source)
+
+    def deploy_and_snapshot(
+        self, name: str, code: str, show_internal: bool = False
+    ) -> Tuple[List[str], str]:
+        """Deploy a contract and return the contract list and state dump in one step."""
+        clean_name = self._validate_deploy(name, code)
+
+        with self._lock:
+            source = self._deploy_locked(clean_name, code)
+            contract_files = list(self._driver.get_contract_files())
+            dump = self._dump_state_locked(show_internal)
+        if source:
+            self._exports_for(clean_name, source)
+        return sorted(contract_files), dump
+
+    @staticmethod
+    def _validate_deploy(name: str, code: str) -> str:
         clean_name = (name or "").strip()
         if not clean_name:
             raise ValueError("Contract name cannot be empty.")
@@ -324,10 +456,14 @@ class ContractingService:
             )
         if not code or not code.strip():
             raise ValueError("Contract code cannot be empty.")
+        return clean_name
 
-        with self._lock:
-            self._client.submit(code, name=clean_name)
-            self._driver.commit()
+    def _deploy_locked(self, clean_name: str, code: str) -> str | None:
+        """Submit and commit a contract; the caller must hold ``self._lock``."""
+        self._client.submit(code, name=clean_name)
+        self._commit_locked()
+        self._exports_cache.pop(clean_name, None)
+        return self._driver.get_contract(clean_name)
 
     def apply_state_snapshot(self, snapshot: Dict[str, Any]) -> None:
         if not isinstance(snapshot, dict):
@@ -341,7 +477,7 @@ class ContractingService:
                     raise ValueError(f"State for '{contract}' must be an object mapping keys to values.")
 
                 existing_keys: set[str] = set()
-                contract_file = self._driver.contract_state / contract
+                contract_file = self._contract_state_dir / contract
                 if contract_file.exists():
                     existing_keys = {
                         key
@@ -367,11 +503,11 @@ class ContractingService:
                     full_key = contract if key == "" else f"{contract}.{key}"
                     self._driver.delete(full_key)
 
-            self._driver.commit()
+            self._commit_locked()
 
     def list_contracts(self) -> List[str]:
         with self._lock:
-            contract_files = self._driver.get_contract_files()
+            contract_files = list(self._driver.get_contract_files())
         return sorted(contract_files)
 
     def list_functions(self, contract: str) -> List[str]:
@@ -384,7 +520,7 @@ class ContractingService:
         if not source:
             return []
 
-        exports = self._parse_exports(source)
+        exports = self._exports_for(contract, source)
         return sorted(export.name for export in exports)
 
     def get_export_metadata(self, contract: str) -> List[ContractExportInfo]:
@@ -397,7 +533,7 @@ class ContractingService:
         if not source:
             return []
 
-        return self._parse_exports(source)
+        return self._exports_for(contract, source)
 
     def get_contract_details(self, contract: str) -> ContractDetails:
         clean_name = (contract or "").strip()
@@ -410,7 +546,7 @@ class ContractingService:
         if source is None:
             raise ValueError(f"Contract '{clean_name}' is not deployed.")
 
-        exports = self._parse_exports(source)
+        exports = self._exports_for(clean_name, source)
         decompiled = self._safe_decompile(source)
         return ContractDetails(
             name=clean_name,
@@ -434,47 +570,67 @@ class ContractingService:
 
             fn = getattr(abstract, function)
             result = fn(**kwargs)
-            self._driver.commit()
+            self._commit_locked()
 
         return ContractingCallResult(result=result)
 
     def dump_state(self, show_internal: bool = False) -> str:
+        # Reads stay under the lock: the driver rewrites these files on commit
+        # and HDF5 refuses a read handle while a write handle is open.
+        with self._lock:
+            return self._dump_state_locked(show_internal)
+
+    def _dump_state_locked(self, show_internal: bool) -> str:
+        """Serialize the current state, reusing the last dump if nothing was committed."""
+        key = (show_internal, self._state_version)
+        cached = self._state_dump_cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        dump = _dumps(self._collect_state_locked(show_internal))
+        self._state_dump_cache = (key, dump)
+        return dump
+
+    def _collect_state_locked(self, show_internal: bool) -> Dict[str, Dict[str, Any]]:
+        """Gather serialized contract and runtime state; the caller must hold ``self._lock``."""
         snapshot: Dict[str, Dict[str, Any]] = {}
+        contract_files = self._driver.get_contract_files()
+        for name in contract_files:
+            file_path = self._contract_state_dir / name
+            try:
+                values = _read_state_file(file_path)
+            except FileNotFoundError:
+                # Listed but already removed (or not yet flushed) - nothing to read.
+                continue
+            snapshot[name] = {
+                key: _serialize_value(value)
+                for key, value in values.items()
+                if show_internal or not key.startswith("__")
+            }
 
-        with self._lock:
-            contract_files = self._driver.get_contract_files()
-            for name in contract_files:
-                file_path = self._driver.contract_state / name
-                keys = hdf5.get_all_keys_from_file(str(file_path))
-                snapshot[name] = {
-                    key: _serialize_value(value)
-                    for key in keys
-                    if (show_internal or not key.startswith("__"))
-                    if (value := hdf5.get_value_from_disk(
-                        str(file_path),
-                        key.replace(constants.DELIMITER, constants.HDF5_GROUP_SEPARATOR),
-                    )) is not None
-                }
-
-            runtime_snapshot: Dict[str, Dict[str, Any]] = {}
-            for path in sorted(self._driver.run_state.iterdir()):
-                if not path.is_file():
-                    continue
-                keys = hdf5.get_all_keys_from_file(str(path))
-                runtime_snapshot[path.name] = {
-                    key: _serialize_value(value)
-                    for key in keys
-                    if (show_internal or not key.startswith("__"))
-                    if (value := hdf5.get_value_from_disk(
-                        str(path),
-                        key.replace(constants.DELIMITER, constants.HDF5_GROUP_SEPARATOR),
-                    )) is not None
-                }
-
-            if runtime_snapshot:
-                snapshot["__runtime__"] = runtime_snapshot
-
-        return json.dumps(snapshot, indent=2, sort_keys=True)
+        runtime_snapshot: Dict[str, Dict[str, Any]] = {}
+        for path in sorted(self._driver.run_state.iterdir()):
+            if not path.is_file():
+                continue
+            values = _read_state_file(path)
+            runtime_snapshot[path.name] = {
+                key: _serialize_value(value)
+                for key, value in values.items()
+                if show_internal or not key.startswith("__")
+            }
+
+        if runtime_snapshot:
+            snapshot["__runtime__"] = runtime_snapshot
+
+        return snapshot
+
+    def _commit_locked(self) -> None:
+        """Commit pending driver writes; the caller must hold ``self._lock``."""
+        try:
+            self._driver.commit()
+        finally:
+            # A commit may touch any contract (and may fail part-way), so the
+            # cached dump is stale from here on.
+            self._state_version += 1
 
     def remove_contract(self, name: str) -> None:
         clean_name = (name or "").strip()
@@ -489,26 +645,79 @@ class ContractingService:
             self._driver.delete_contract(clean_name)
             self._driver.flush_file(clean_name)
             self._driver.flush_cache()
-            self._driver.commit()
+            self._commit_locked()
+            self._exports_cache.pop(clean_name, None)
+            self._exports_index_path(clean_name).unlink(missing_ok=True)
 
     def reset_state(self) -> None:
         with self._lock:
             self._driver.flush_full()
             self._driver = Driver(storage_home=self._storage_home)
+            self._contract_state_dir = self._driver.contract_state
+            self._exports_cache.clear()
+            self._state_version += 1
+            shutil.rmtree(self._exports_dir, ignore_errors=True)
         self._client = ContractingService._create_client(driver=self._driver)
         self._environment = self._client.environment
         self._apply_default_environment()
         self._prune_environment()
 
+    def _exports_for(self, contract: str, source: str) -> List[ContractExportInfo]:
+        """Return exports for ``source``, reusing the cached parse when it is unchanged."""
+        digest = hashlib.blake2b(source.encode("utf-8"), digest_size=16).digest()
+        cached = self._exports_cache.get(contract)
+        if cached is not None and cached[0] == digest:
+            return list(cached[1])
+        exports = self._read_exports_index(contract, digest)
+        if exports is None:
+            exports = self._parse_exports(source)
+            self._write_exports_index(contract, digest, exports)
+        self._exports_cache[contract] = (digest, exports)
+        return list(exports)
+
+    def _exports_index_path(self, contract: str) -> Path:
+        return self._exports_dir / f"{contract}.json"
+
+    def _read_exports_index(self, contract: str, digest: bytes) -> List[ContractExportInfo] | None:
+        """Load exports persisted for this exact source, or None if unavailable."""
+        try:
+            data = json.loads(self._exports_index_path(contract).read_text())
+            if data.get("digest") != digest.hex():
+                return None
+            return [
+                ContractExportInfo(
+                    name=entry["name"],
+                    docstring=entry.get("docstring", ""),
+                    parameters=[FunctionParameter(**param) for param in entry.get("parameters") or []],
+                )
+                for entry in data["exports"]
+            ]
+        except (OSError, ValueError, TypeError, KeyError, AttributeError):
+            return None
+
+    def _write_exports_index(self, contract: str, digest: bytes, exports: List[ContractExportInfo]) -> None:
+        """Persist parsed exports next to the contract state; best effort only."""
+        payload = {"digest": digest.hex(), "exports": [asdict(export) for export in exports]}
+        try:
+            self._exports_dir.mkdir(parents=True, exist_ok=True)
+            self._exports_index_path(contract).write_text(json.dumps(payload))
+        except OSError:
+            pass
+
     @staticmethod
     def _parse_exports(source: str) -> List[ContractExportInfo]:
+        # Sources without any export decorator cannot export anything; skip the parse.
+        if not _EXPORT_MARKER.search(source):
+            return []
         try:
             tree = ast.parse(source)
         except SyntaxError:
             return []
 
         exports: List[ContractExportInfo] = []
-        for node in ast.walk(tree):
+        # Contracting only exports module-level functions, so the top-level body
+        # is all that needs scanning.
+        for node in tree.body:
             if isinstance(node, ast.FunctionDef) and any(
                 _is_export_decorator(dec) for dec in node.decorator_list
             ):
@@ -2,9 +2,8 @@
 
 from __future__ import annotations
 
-import atexit
-from concurrent.futures import ThreadPoolExecutor
-from typing import List
+import hashlib
+from typing import List, Tuple
 
 from xian_linter.linter import LintError_Model, lint_code_inline  # type: ignore
 
@@ -28,14 +27,20 @@ def _format_error(error: LintError_Model) -> str:
     return f"{location}{message}"
 
 
-# Keep linting work isolated from the main event loop and shut down cleanly.
-_EXECUTOR = ThreadPoolExecutor(max_workers=1)
-atexit.register(_EXECUTOR.shutdown, wait=False)
+# (source digest, formatted results) of the most recent lint run.
+_LINT_CACHE: Tuple[bytes, List[str]] | None = None
 
 
 def lint_contract(code: str) -> List[str]:
     """Run the linter synchronously using xian-linter's inline helper."""
+    global _LINT_CACHE
 
-    future = _EXECUTOR.submit(lint_code_inline, code)
-    errors = future.result()
-    return [_format_error(error) for error in errors]
+    digest = hashlib.blake2b(code.encode("utf-8"), digest_size=16).digest()
+    cached = _LINT_CACHE
+    if cached is not None and cached[0] == digest:
+        return list(cached[1])
+
+    errors = lint_code_inline(code)
+    results = [_format_error(error) for error in errors]
+    _LINT_CACHE = (digest, results)
+    return list(results)
@@ -204,6 +204,12 @@ class SessionRuntimeManager:
         service = self._get_service(session_id)
         service.deploy(name, code)
 
+    def deploy_and_snapshot(
+        self, session_id: str, name: str, code: str, show_internal: bool
+    ) -> tuple[list[str], str]:
+        service = self._get_service(session_id)
+        return service.deploy_and_snapshot(name, code, show_internal)
+
     def call(self, session_id: str, contract: str, function: str, kwargs: Dict[str, Any]):
         service = self._get_service(session_id)
         return service.call(contract, function, kwargs)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import ast
+import asyncio
 import json
 import os
 import time
@@ -53,14 +54,29 @@ def _format_bytes(value: int) -> str:
 
 STATE_IMPORT_MAX_BYTES = _env_positive_int("PLAYGROUND_STATE_IMPORT_MAX_BYTES", 10 * 1024 * 1024)
 ACTIVITY_LOG_MAX_ENTRIES = _env_positive_int("PLAYGROUND_ACTIVITY_LOG_MAX_ENTRIES", 50)
+# Up to this many lint findings are shown as one pre-wrapped text block.
+LINT_JOINED_MAX_RESULTS = 10
 LOG_LEVEL_COLORS = {
     "info": "#3b82f6",
     "success": "#10b981",
     "error": "#ef4444",
     "warning": "#f59e0b",
 }
-ENVIRONMENT_FIELD_KEYS = [field["key"] for field in ENVIRONMENT_FIELDS]
+ENVIRONMENT_FIELD_KEYS = [field.key for field in ENVIRONMENT_FIELDS]
+_ENVIRONMENT_FIELD_KEY_SET = frozenset(ENVIRONMENT_FIELD_KEYS)
+_EMPTY_ENVIRONMENT_EDITOR = dict.fromkeys(ENVIRONMENT_FIELD_KEYS, "")
+
+
+def _environment_editor_values(env: Dict[str, object]) -> Dict[str, str]:
+    """Project an environment mapping onto the editable fields as strings."""
+    editor = dict(_EMPTY_ENVIRONMENT_EDITOR)
+    for key in _ENVIRONMENT_FIELD_KEY_SET.intersection(env):
+        editor[key] = stringify_environment_value(env[key])
+    return editor
+
 FULLSCREEN_PANELS = {"write", "load", "execute", "state"}
+# Window in which scheduled state refreshes are coalesced into one dump.
+STATE_REFRESH_COALESCE_SECONDS = 0.05
 
 class PlaygroundState(rx.State):
     """Global Reflex state powering the playground UI."""
@@ -74,9 +90,7 @@ class PlaygroundState(rx.State):
     expert_message: str = ""
     expert_is_error: bool = False
     show_internal_state: bool = False
-    environment_editor: dict[str, str] = {
-        key: DEFAULT_ENVIRONMENT.get(key, "") for key in ENVIRONMENT_FIELD_KEYS
-    }
+    environment_editor: dict[str, str] = _environment_editor_values(DEFAULT_ENVIRONMENT)
     session_id: str = ""
     session_error: str = ""
     resume_session_input: str = ""
@@ -85,6 +99,8 @@ class PlaygroundState(rx.State):
     state_is_editing: bool = False
     state_editor: str = ""
     lint_results: List[str] = []
+    # lint_results joined into one block, filled only for short lists.
+    lint_short_results_text: str = ""
     linting: bool = False
     lint_has_results: bool = False
 
@@ -105,7 +121,9 @@ class PlaygroundState(rx.State):
     state_dump: str = "{}"
     _saved_code_snapshot: str = DEFAULT_CONTRACT
     log_entries: List[Dict[str, str]] = []
+    _log_seq: int = 0
     _state_edit_snapshot: str = ""
+    _state_refresh_pending: bool = False
     activity_log_view_key: str = "activity-log"
 
     def on_load(self):
@@ -122,10 +140,7 @@ class PlaygroundState(rx.State):
 
         self._apply_ui_state(metadata.ui_state or {})
         env_snapshot = session_runtime.get_environment_snapshot(session_id)
-        self.environment_editor = {
-            key: env_snapshot.get(key, "")
-            for key in ENVIRONMENT_FIELD_KEYS
-        }
+        self.environment_editor = _environment_editor_values(env_snapshot)
         self.session_error = ""
         self._last_ui_snapshot_ts = time.time()
         self._refresh_activity_log_panel()
@@ -199,7 +214,9 @@ class PlaygroundState(rx.State):
         detail = (detail or "").strip()
         if len(detail) > 4000:
             detail = detail[:4000] + "…"
+        self._log_seq += 1
         entry = {
+            "id": str(self._log_seq),
             "timestamp": time.strftime("%Y-%m-%d %H:%M:%S", time.localtime()),
             "level": normalized_level,
             "level_label": normalized_level.title(),
@@ -208,10 +225,8 @@ class PlaygroundState(rx.State):
             "detail": detail,
             "color": LOG_LEVEL_COLORS.get(normalized_level, LOG_LEVEL_COLORS["info"]),
         }
-        entries = [entry] + self.log_entries
-        if len(entries) > ACTIVITY_LOG_MAX_ENTRIES:
-            entries = entries[:ACTIVITY_LOG_MAX_ENTRIES]
-        self.log_entries = entries
+        # One bounded copy: the oldest entries past the cap are never copied.
+        self.log_entries = [entry, *self.log_entries[: ACTIVITY_LOG_MAX_ENTRIES - 1]]
 
     def _log_success(self, action: str, message: str, detail: str = "") -> None:
         self._log_event("success", action, message, detail)
@@ -342,7 +357,9 @@ class PlaygroundState(rx.State):
         if not session_runtime.session_exists(target):
             self.session_error = "Session not found."
             return [rx.toast.error(self.session_error)]
-        self.session_error = ""
+        if self.session_error:
+            # Reflex marks a var dirty on every assignment; skip a no-op delta.
+            self.session_error = ""
         return self._navigate_to_session_route(target)
 
     def save_code_draft(self):
@@ -354,8 +371,8 @@ class PlaygroundState(rx.State):
 
     def update_code(self, value: str):
         self.code_editor = value or ""
-        self.lint_results = []
-        self.lint_has_results = False
+        if self.lint_has_results:
+            self._set_lint_results([])
 
     def update_contract_name(self, value: str):
         self.contract_name = value
@@ -516,14 +533,10 @@ class PlaygroundState(rx.State):
         self.state_is_editing = False
         self.state_dump = "{}"
         self.state_editor = "{}"
-        self.lint_results = []
-        self.lint_has_results = False
+        self._set_lint_results([])
         self._hydrate_code_editor(DEFAULT_CONTRACT, force_refresh=True)
         self.contract_name = DEFAULT_CONTRACT_NAME
-        self.environment_editor = {
-            key: stringify_environment_value(env.get(key))
-            for key in ENVIRONMENT_FIELD_KEYS
-        }
+        self.environment_editor = _environment_editor_values(env)
         self._save_session(include_code=True)
         self._log_success("reset_state", "All contracts and state cleared.")
 
@@ -654,26 +667,51 @@ class PlaygroundState(rx.State):
         if not session_id:
             return []
         snapshot = session_runtime.dump_state(session_id, self.show_internal_state)
-        self.state_dump = snapshot
-        if not self.state_is_editing:
+        # Skip the assignment when nothing changed so no delta is pushed.
+        if snapshot != self.state_dump:
+            self.state_dump = snapshot
+        if not self.state_is_editing and snapshot != self.state_editor:
             self.state_editor = snapshot
 
+    @rx.event(background=True)
+    async def schedule_refresh_state(self):
+        """Refresh the state dump once per burst of deploys/executions."""
+        async with self:
+            if self._state_refresh_pending:
+                return
+            self._state_refresh_pending = True
+        cleared = False
+        try:
+            await asyncio.sleep(STATE_REFRESH_COALESCE_SECONDS)
+            async with self:
+                self._state_refresh_pending = False
+                cleared = True
+                self.refresh_state()
+        finally:
+            if not cleared:
+                # Cancelled (disconnect, reload) or failed before the refresh:
+                # a stuck flag would silently skip every later refresh.
+                async with self:
+                    self._state_refresh_pending = False
+
     def refresh_environment(self):
         session_id = self._require_session()
         if not session_id:
             return []
         env = session_runtime.get_environment(session_id)
-        self.environment_editor = {
-            key: stringify_environment_value(env.get(key))
-            for key in ENVIRONMENT_FIELD_KEYS
-        }
+        self.environment_editor = _environment_editor_values(env)
 
     def deploy_contract(self):
         session_id = self._require_session()
         if not session_id:
             return []
         try:
-            session_runtime.deploy(session_id, self.contract_name, self.code_editor)
+            contracts, snapshot = session_runtime.deploy_and_snapshot(
+                session_id,
+                self.contract_name,
+                self.code_editor,
+                self.show_internal_state,
+            )
         except ContractWorkerInvocationError as exc:
             self.deploy_is_error = True
             message = self._log_worker_failure("deploy", "Deploy failed: ", exc)
@@ -691,12 +729,15 @@ class PlaygroundState(rx.State):
         self.selected_contract = self.contract_name
         self.load_selected_contract = self.contract_name
         self.kwargs_input = DEFAULT_KWARGS_INPUT
+        self.deployed_contracts = contracts
+        self.state_dump = snapshot
+        if not self.state_is_editing:
+            self.state_editor = snapshot
         self._save_session(include_code=True)
 
         events = [
             rx.toast.success(self.deploy_message),
-            type(self).refresh_contracts,
-            type(self).refresh_state,
+            type(self).refresh_functions,
             type(self).refresh_environment,
             type(self).refresh_loaded_contract,
         ]
@@ -719,7 +760,7 @@ class PlaygroundState(rx.State):
             value = value.get("value", "")
         if not key:
             return
-        if key in self.environment_editor:
+        if key in _ENVIRONMENT_FIELD_KEY_SET:
             self.environment_editor[key] = value
 
     def apply_environment_value(self, key):
@@ -849,6 +890,14 @@ class PlaygroundState(rx.State):
         self._log_success("state_edit", "State updated from editor changes.", detail=detail)
         return [rx.toast.success("State updated.")]
 
+    def _set_lint_results(self, results: List[str]) -> None:
+        self.lint_results = results
+        # Short lists render as one text node; only long ones get a row per finding.
+        self.lint_short_results_text = (
+            "\n".join(results) if len(results) <= LINT_JOINED_MAX_RESULTS else ""
+        )
+        self.lint_has_results = bool(results)
+
     def lint_contract(self):
         if self.linting:
             return []
@@ -858,8 +907,7 @@ class PlaygroundState(rx.State):
             raw_results = run_lint(self.code_editor)
         except Exception as exc:
             self.linting = False
-            self.lint_results = []
-            self.lint_has_results = False
+            self._set_lint_results([])
             return [rx.toast.error(f"Lint failed: {exc}")]
 
         self.linting = False
@@ -880,8 +928,7 @@ class PlaygroundState(rx.State):
             else:
                 formatted.append(str(result))
 
-        self.lint_results = formatted
-        self.lint_has_results = bool(formatted)
+        self._set_lint_results(formatted)
 
         if formatted:
             return [
@@ -891,7 +938,7 @@ class PlaygroundState(rx.State):
 
     def _parse_kwargs(self) -> dict:
         raw = self.kwargs_input.strip()
-        if not raw:
+        if not raw or raw == "{}":
             return {}
         try:
             data = json.loads(raw)
@@ -964,6 +1011,6 @@ class PlaygroundState(rx.State):
         )
         return [
             rx.toast.success("Execution succeeded."),
-            type(self).refresh_state,
+            type(self).schedule_refresh_state,
             type(self).refresh_contracts,
         ]
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+import unittest
+from types import SimpleNamespace
+
+from playground.state import LINT_JOINED_MAX_RESULTS, PlaygroundState
+
+
+def _apply(results: list[str]) -> SimpleNamespace:
+    target = SimpleNamespace()
+    PlaygroundState._set_lint_results(target, results)
+    return target
+
+
+class LintResultsStateTest(unittest.TestCase):
+    def test_short_lists_also_fill_the_joined_text(self) -> None:
+        results = [f"Line {n}: boom" for n in range(LINT_JOINED_MAX_RESULTS)]
+        target = _apply(results)
+
+        self.assertEqual(target.lint_results, results)
+        self.assertEqual(target.lint_short_results_text, "\n".join(results))
+        self.assertTrue(target.lint_has_results)
+
+    def test_long_lists_keep_every_result_without_joined_text(self) -> None:
+        results = [f"Line {n}: boom" for n in range(LINT_JOINED_MAX_RESULTS + 1)]
+        target = _apply(results)
+
+        self.assertEqual(target.lint_results, results)
+        self.assertEqual(target.lint_short_results_text, "")
+        self.assertTrue(target.lint_has_results)
+
+    def test_empty_results_clear_everything(self) -> None:
+        target = _apply([])
+
+        self.assertEqual(target.lint_results, [])
+        self.assertEqual(target.lint_short_results_text, "")
+        self.assertFalse(target.lint_has_results)
+
+
+if __name__ == "__main__":
+    unittest.main()
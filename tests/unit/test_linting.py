@@ -4,9 +4,13 @@ import unittest
 from unittest import mock
 
 from playground.services import lint_contract
+from playground.services import linting
 
 
 class LintingHelpersTest(unittest.TestCase):
+    def setUp(self) -> None:
+        linting._LINT_CACHE = None
+
     def test_lint_contract_calls_inline_linter(self) -> None:
         mock_error_with_position = mock.Mock()
         mock_error_with_position.message = "boom"
@@ -23,6 +27,19 @@ class LintingHelpersTest(unittest.TestCase):
         inline.assert_called_once_with("contract code")
         self.assertEqual(results, ["Line 1, Col 2: boom", "oops"])
 
+    def test_lint_contract_reuses_result_for_unchanged_source(self) -> None:
+        mock_error = mock.Mock(message="boom", position=None)
+
+        with mock.patch("playground.services.linting.lint_code_inline") as inline:
+            inline.return_value = [mock_error]
+            first = lint_contract("contract code")
+            second = lint_contract("contract code")
+            lint_contract("other code")
+
+        self.assertEqual(first, ["boom"])
+        self.assertEqual(second, ["boom"])
+        self.assertEqual(inline.call_count, 2)
+
 
 if __name__ == "__main__":
     unittest.main()
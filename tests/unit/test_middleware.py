@@ -1,17 +1,25 @@
 from __future__ import annotations
 
+import asyncio
 import os
 import unittest
 from contextlib import contextmanager
+from types import SimpleNamespace
+from unittest import mock
 
 from starlette.requests import Request
 from starlette.responses import Response
+from starlette.testclient import TestClient
 
 from playground.middleware import (
+    SessionCookieMiddleware,
     _env_secure_cookie_override,
+    _extract_cookie,
     _infer_secure_cookie,
+    current_session_id,
     issue_session_cookie,
 )
+from playground.services import SESSION_COOKIE_MAX_AGE, SessionNotFoundError
 
 
 def _make_request(*, scheme: str = "http", headers: dict[str, str] | None = None) -> Request:
@@ -32,6 +40,11 @@ def _make_request(*, scheme: str = "http", headers: dict[str, str] | None = None
     return Request(scope)
 
 
+def _override(value: bool | None):
+    """Patch the env override the middleware read at import."""
+    return mock.patch("playground.middleware._ENV_SECURE_OVERRIDE", value)
+
+
 @contextmanager
 def _env(var: str, value: str | None):
     original = os.environ.get(var)
@@ -66,7 +79,7 @@ class MiddlewareSecurityTest(unittest.TestCase):
     def test_issue_cookie_marks_secure_when_https(self) -> None:
         request = _make_request(scheme="https")
         response = Response()
-        with _env("PLAYGROUND_SESSION_COOKIE_SECURE", None):
+        with _override(None):
             issue_session_cookie(response, "abc", request=request)
         header = response.headers["set-cookie"]
         self.assertIn("Secure", header)
@@ -74,11 +87,235 @@ class MiddlewareSecurityTest(unittest.TestCase):
     def test_issue_cookie_omits_secure_when_overridden_false(self) -> None:
         request = _make_request(scheme="https")
         response = Response()
-        with _env("PLAYGROUND_SESSION_COOKIE_SECURE", "0"):
+        with _override(False):
             issue_session_cookie(response, "abc", request=request)
         header = response.headers["set-cookie"]
         self.assertNotIn("Secure", header)
 
+    def test_extract_cookie_matches_whole_names_only(self) -> None:
+        header = b"other_xian_session_id=nope; theme=dark;xian_session_id=abc123 ; x=1"
+        self.assertEqual(_extract_cookie(header), "abc123")
+        self.assertEqual(_extract_cookie(b"xian_session_id=solo"), "solo")
+        self.assertIsNone(_extract_cookie(b"theme=dark"))
+
+
+async def _receive_empty() -> dict:
+    return {"type": "http.request", "body": b"", "more_body": False}
+
+
+async def _discard(message: dict) -> None:
+    pass
+
+
+class FakeSessionRuntime:
+    """Resolves the known session ids case-insensitively, like the repository."""
+
+    def __init__(self, *known: str):
+        self.known = set(known)
+        self.lookups: list[str | None] = []
+
+    def resolve_or_create(self, session_id, *, create_if_missing=True):
+        self.lookups.append(session_id)
+        normalized = (session_id or "").lower()
+        if normalized in self.known:
+            return SimpleNamespace(session_id=normalized), False
+        raise SessionNotFoundError(session_id or "missing-session-id")
+
+
+class SessionCookieMiddlewareTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.runtime = FakeSessionRuntime("abc123")
+        patcher = mock.patch("playground.middleware.session_runtime", self.runtime)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.seen: list[dict] = []
+
+    async def _app(self, scope, receive, send) -> None:
+        self.seen.append(
+            {
+                "state": scope.get("state", {}).get("session_id"),
+                "context": current_session_id(),
+            }
+        )
+        response = Response("ok", headers={"x-upstream": "1"})
+        response.set_cookie("theme", "dark")
+        await response(scope, receive, send)
+
+    def _client(self, **kwargs) -> TestClient:
+        return TestClient(SessionCookieMiddleware(self._app, **kwargs))
+
+    def test_request_without_cookie_skips_lookup(self) -> None:
+        response = self._client(secure=False).get("/")
+
+        self.assertEqual(self.runtime.lookups, [])
+        self.assertEqual(self.seen, [{"state": None, "context": None}])
+        self.assertEqual(response.headers.get_list("set-cookie"), ["theme=dark; Path=/; SameSite=lax"])
+
+    def test_valid_cookie_is_not_rewritten(self) -> None:
+        response = self._client(secure=False).get(
+            "/", headers={"cookie": "xian_session_id=abc123"}
+        )
+
+        self.assertEqual(self.seen, [{"state": "abc123", "context": "abc123"}])
+        self.assertNotIn("xian_session_id", response.headers.get("set-cookie", ""))
+
+    def test_unknown_cookie_resolves_to_no_session(self) -> None:
+        response = self._client(secure=False).get(
+            "/", headers={"cookie": "xian_session_id=missing"}
+        )
+
+        self.assertEqual(self.runtime.lookups, ["missing"])
+        self.assertEqual(self.seen, [{"state": None, "context": None}])
+        self.assertNotIn("xian_session_id", response.headers.get("set-cookie", ""))
+
+    def test_non_normalized_cookie_is_rewritten(self) -> None:
+        response = self._client(secure=False).get(
+            "/", headers={"cookie": "xian_session_id=ABC123"}
+        )
+
+        self.assertEqual(self.seen, [{"state": "abc123", "context": "abc123"}])
+        cookies = response.headers.get_list("set-cookie")
+        self.assertIn(
+            "xian_session_id=abc123; HttpOnly; Max-Age=%d; Path=/; SameSite=lax"
+            % SESSION_COOKIE_MAX_AGE,
+            cookies,
+        )
+
+    def test_rewritten_cookie_is_appended_to_existing_headers(self) -> None:
+        response = self._client(secure=False).get(
+            "/", headers={"cookie": "xian_session_id=ABC123"}
+        )
+
+        self.assertEqual(response.headers["x-upstream"], "1")
+        cookies = response.headers.get_list("set-cookie")
+        self.assertEqual(len(cookies), 2)
+        self.assertTrue(cookies[0].startswith("theme=dark"))
+        self.assertTrue(cookies[1].startswith("xian_session_id=abc123"))
+
+    def test_skip_prefixes_bypass_session_handling(self) -> None:
+        client = self._client(secure=False)
+        for path in ("/_next/static/app.js", "/static/logo.svg", "/assets/x.css", "/favicon.ico"):
+            with self.subTest(path=path):
+                response = client.get(path, headers={"cookie": "xian_session_id=ABC123"})
+                self.assertNotIn("xian_session_id", response.headers.get("set-cookie", ""))
+
+        self.assertEqual(self.runtime.lookups, [])
+        self.assertTrue(all(entry == {"state": None, "context": None} for entry in self.seen))
+
+    def test_secure_suffix_follows_forwarded_proto(self) -> None:
+        with _override(None), mock.patch(
+            "playground.middleware._deploy_is_https", return_value=False
+        ):
+            client = self._client()
+            secure = client.get(
+                "/",
+                headers={"cookie": "xian_session_id=ABC123", "x-forwarded-proto": "https"},
+            )
+            plain = client.get(
+                "/",
+                headers={"cookie": "xian_session_id=ABC123", "x-forwarded-proto": "http"},
+            )
+
+        self.assertTrue(secure.headers.get_list("set-cookie")[-1].endswith("; Secure"))
+        self.assertNotIn("Secure", plain.headers.get_list("set-cookie")[-1])
+
+    def test_session_cookie_survives_split_cookie_headers(self) -> None:
+        middleware = SessionCookieMiddleware(self._app, secure=False)
+        for headers in (
+            [(b"cookie", b"xian_session_id=abc123"), (b"cookie", b"theme=dark")],
+            [(b"cookie", b"theme=dark"), (b"cookie", b"xian_session_id=abc123")],
+        ):
+            with self.subTest(headers=headers):
+                self.seen.clear()
+                scope = {"type": "http", "path": "/", "scheme": "http", "headers": headers}
+                asyncio.run(middleware(scope, _receive_empty, _discard))
+                self.assertEqual(self.seen, [{"state": "abc123", "context": "abc123"}])
+
+    def test_blank_forwarded_proto_falls_back_to_scheme(self) -> None:
+        with _override(None), mock.patch(
+            "playground.middleware._deploy_is_https", return_value=False
+        ):
+            response = TestClient(
+                SessionCookieMiddleware(self._app), base_url="https://testserver"
+            ).get(
+                "/",
+                headers={"cookie": "xian_session_id=ABC123", "x-forwarded-proto": ""},
+            )
+
+        self.assertTrue(response.headers.get_list("set-cookie")[-1].endswith("; Secure"))
+
+    def test_duplicated_proxy_headers_use_the_first_value(self) -> None:
+        cases = (
+            ([(b"x-forwarded-proto", b"https"), (b"x-forwarded-proto", b"http")], True),
+            ([(b"x-forwarded-proto", b"http"), (b"x-forwarded-proto", b"https")], False),
+            ([(b"forwarded", b"proto=https"), (b"forwarded", b"proto=http")], True),
+            ([(b"forwarded", b"proto=http"), (b"forwarded", b"proto=https")], False),
+        )
+        with _override(None), mock.patch(
+            "playground.middleware._deploy_is_https", return_value=False
+        ):
+            middleware = SessionCookieMiddleware(self._app)
+            for proxy_headers, expected in cases:
+                with self.subTest(headers=proxy_headers):
+                    headers = [(b"cookie", b"xian_session_id=ABC123"), *proxy_headers]
+                    messages: list[dict] = []
+
+                    async def send(message: dict) -> None:
+                        messages.append(message)
+
+                    scope = {"type": "http", "path": "/", "scheme": "http", "headers": headers}
+                    asyncio.run(middleware(scope, _receive_empty, send))
+                    cookie = messages[0]["headers"][-1][1]
+                    issued = Response()
+                    request = Request(
+                        dict(scope, headers=[*headers, (b"host", b"example.com")], query_string=b"")
+                    )
+                    issue_session_cookie(issued, "abc123", request=request)
+
+                    self.assertEqual(cookie.endswith(b"; Secure"), expected)
+                    self.assertEqual("Secure" in issued.headers["set-cookie"], expected)
+
+    def test_env_override_matches_issue_session_cookie(self) -> None:
+        for value in (False, True):
+            # The live environment says the opposite; only the import-time value counts.
+            with self.subTest(value=value), _override(value), _env(
+                "PLAYGROUND_SESSION_COOKIE_SECURE", "0" if value else "1"
+            ):
+                response = self._client().get(
+                    "/",
+                    headers={"cookie": "xian_session_id=ABC123", "x-forwarded-proto": "https"},
+                )
+                issued = Response()
+                issue_session_cookie(issued, "abc123", request=_make_request(scheme="https"))
+
+                self.assertEqual(response.headers.get_list("set-cookie")[-1].endswith("; Secure"), value)
+                self.assertEqual("Secure" in issued.headers["set-cookie"], value)
+
+    def test_session_context_is_reset_after_request(self) -> None:
+        middleware = SessionCookieMiddleware(self._app, secure=False)
+        scope = {
+            "type": "http",
+            "method": "GET",
+            "path": "/",
+            "scheme": "http",
+            "headers": [(b"cookie", b"xian_session_id=abc123")],
+        }
+        messages: list[dict] = []
+
+        async def receive() -> dict:
+            return {"type": "http.request", "body": b"", "more_body": False}
+
+        async def send(message: dict) -> None:
+            messages.append(message)
+
+        async def run() -> str | None:
+            await middleware(scope, receive, send)
+            return current_session_id()
+
+        self.assertIsNone(asyncio.run(run()))
+        self.assertEqual(self.seen, [{"state": "abc123", "context": "abc123"}])
+        self.assertEqual(messages[0]["type"], "http.response.start")
+
 
 if __name__ == "__main__":
     unittest.main()
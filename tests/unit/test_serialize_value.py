@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import decimal
+import json
+import unittest
+from unittest import mock
+
+from contracting.stdlib.bridge.decimal import ContractingDecimal
+from contracting.stdlib.bridge.time import Datetime
+
+from playground.services import contracting
+from playground.services.contracting import _dumps, _serialize_value
+
+
+class SerializeValueTest(unittest.TestCase):
+    def test_scalars_pass_through_or_convert(self) -> None:
+        moment = Datetime(2024, 2, 1, 12, 30)
+        cases = [
+            (1, 1),
+            (1.5, 1.5),
+            ("text", "text"),
+            (True, True),
+            (None, None),
+            (decimal.Decimal("1.10"), "1.10"),
+            (ContractingDecimal("2.5"), str(ContractingDecimal("2.5"))),
+            (moment, str(moment)),
+            (b"\x00\xff", "00ff"),
+        ]
+        for value, expected in cases:
+            with self.subTest(value=value):
+                self.assertEqual(_serialize_value(value), expected)
+
+    def test_nested_containers_are_converted_in_place(self) -> None:
+        value = {
+            "balances": {"alice": decimal.Decimal("3.0"), 7: [b"\x01", (1, 2)]},
+            "history": ({"at": Datetime(2024, 1, 1)}, [decimal.Decimal("1")]),
+            "flags": {True},
+        }
+
+        self.assertEqual(
+            _serialize_value(value),
+            {
+                "balances": {"alice": "3.0", "7": ["01", [1, 2]]},
+                "history": [{"at": str(Datetime(2024, 1, 1))}, ["1"]],
+                "flags": [True],
+            },
+        )
+
+    def test_colliding_keys_keep_the_last_value(self) -> None:
+        value = {1: "int", "1": "str", "nested": {None: 1, "None": {2: "a", "2": "b"}}}
+
+        serialized = _serialize_value(value)
+
+        self.assertEqual(serialized, {"1": "str", "nested": {"None": {"2": "b"}}})
+        self.assertEqual(list(serialized), ["1", "nested"])
+
+
+class DumpsTest(unittest.TestCase):
+    SAMPLE = {
+        "name": "Zoë ✓ 🚀",
+        "nested": {"b": [1, 2.5, None], "a": {"inf": float("inf"), "nan": float("nan")}},
+        "empty": {"list": [], "dict": {}},
+        "flag": False,
+    }
+
+    def _fallback(self, data) -> str:
+        with mock.patch.object(contracting, "orjson", None):
+            return _dumps(data)
+
+    def test_fallback_output_is_pinned(self) -> None:
+        text = self._fallback(self.SAMPLE)
+
+        self.assertIn('"name": "Zoë ✓ 🚀"', text)
+        self.assertIn('"inf": null', text)
+        self.assertIn('"nan": null', text)
+        self.assertEqual(json.loads(text)["nested"]["b"], [1, 2.5, None])
+
+    def test_orjson_and_fallback_agree(self) -> None:
+        if contracting.orjson is None:
+            self.skipTest("orjson is not installed")
+        big = dict(self.SAMPLE, big=2**70)
+        for data in (self.SAMPLE, big):
+            with self.subTest(big="big" in data):
+                self.assertEqual(_dumps(data), self._fallback(data))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from playground.services.contracting import ContractingService
+
+
+COUNTER_CONTRACT = """
+counter = Variable()
+
+
+@construct
+def seed():
+    counter.set(10)
+
+
+@export
+def set_counter(value: int):
+    counter.set(value)
+"""
+
+
+class StateDumpCacheTest(unittest.TestCase):
+    def test_dump_sees_rewrite_that_keeps_file_mtime(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            service = ContractingService(storage_home=Path(tmpdir))
+            service.deploy("demo", COUNTER_CONTRACT)
+            state_file = service._contract_state_dir / "demo"
+            before = json.loads(service.dump_state())
+            stat = state_file.stat()
+
+            service.call("demo", "set_counter", {"value": 20})
+            # Same-size rewrite inside the timestamp granularity: the file looks untouched.
+            os.utime(state_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+            after = json.loads(service.dump_state())
+
+        self.assertEqual(before["demo"]["counter"], 10)
+        self.assertEqual(after["demo"]["counter"], 20)
+
+    def test_dump_reflects_each_committed_change(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            service = ContractingService(storage_home=Path(tmpdir))
+            service.deploy("demo", COUNTER_CONTRACT)
+            first = service.dump_state()
+            repeated = service.dump_state()
+
+            service.call("demo", "set_counter", {"value": 11})
+            after_call = service.dump_state()
+
+            service.apply_state_snapshot({"demo": {"counter": 12}})
+            after_import = service.dump_state()
+
+        self.assertEqual(repeated, first)
+        self.assertEqual(json.loads(first)["demo"]["counter"], 10)
+        self.assertEqual(json.loads(after_call)["demo"]["counter"], 11)
+        self.assertEqual(json.loads(after_import)["demo"], {"counter": 12})
+
+
+if __name__ == "__main__":
+    unittest.main()